@@ -3,19 +3,174 @@
 # This file handles loading and parsing of the configuration file
 
 import os
+import re
 import sys
 import logging
-import configparser
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, TextIO
+
+
+class FastConfigParser:
+    """Lightweight INI parser covering the subset of configparser used by Palioxis"""
+    
+    __slots__ = ('_data',)
+
+    SECTION_RE = re.compile(r'^\[(.+)\]\s*$')
+    ENTRY_RE = re.compile(r'^([^=:\s][^=:]*?)\s*[=:]\s*(.*?)\s*$')
+    BOOLEAN_STATES = {'1': True, 'yes': True, 'true': True, 'on': True,
+                      '0': False, 'no': False, 'false': False, 'off': False}
+
+    def __init__(self):
+        self._data: Dict[str, Dict[str, Optional[str]]] = {}
+
+    def read(self, path: str) -> List[str]:
+        """Read and parse a configuration file, returning the list of files read"""
+        try:
+            with open(path, 'r') as f:
+                self.read_file(f)
+        except OSError:
+            return []
+        return [path]
+
+    def read_file(self, f: TextIO) -> None:
+        """Parse configuration data from an open file object"""
+        section = None
+        option = None
+        for line in f:
+            stripped = line.strip()
+            if not stripped or stripped[0] in '#;':
+                continue
+
+            # Indented lines continue the value of the previous option
+            if line[0].isspace() and section is not None and option is not None:
+                value = section[option]
+                section[option] = stripped if not value else value + '\n' + stripped
+                continue
+
+            m = self.SECTION_RE.match(stripped)
+            if m:
+                section = self._data.setdefault(m.group(1), {})
+                option = None
+                continue
+
+            if section is None:
+                raise ValueError(f"Option outside of a section: {stripped!r}")
+
+            m = self.ENTRY_RE.match(stripped)
+            if m:
+                option = m.group(1).lower()
+                section[option] = m.group(2)
+            else:
+                # Option without a value (allow_no_value semantics)
+                option = stripped.lower()
+                section[option] = None
+
+    def sections(self) -> List[str]:
+        """Return the list of section names"""
+        return list(self._data)
+
+    def has_section(self, section: str) -> bool:
+        return section in self._data
+
+    def add_section(self, section: str) -> None:
+        if section in self._data:
+            raise ValueError(f"Section {section!r} already exists")
+        self._data[section] = {}
+
+    def has_option(self, section: str, option: str) -> bool:
+        return option.lower() in self._data.get(section, ())
+
+    def options(self, section: str) -> List[str]:
+        return list(self._data[section])
+
+    def get(self, section: str, option: str) -> Optional[str]:
+        """Get a raw string value, raising KeyError if the section or option is missing"""
+        return self._data[section][option.lower()]
+
+    def getint(self, section: str, option: str) -> int:
+        return int(self.get(section, option))
+
+    def getfloat(self, section: str, option: str) -> float:
+        return float(self.get(section, option))
+
+    def getboolean(self, section: str, option: str) -> bool:
+        value = self.get(section, option)
+        try:
+            return self.BOOLEAN_STATES[str(value).lower()]
+        except KeyError:
+            raise ValueError(f"Not a boolean: {value}")
+
+    def set(self, section: str, option: str, value: Optional[str] = None) -> None:
+        self._data[section][option.lower()] = value
+
+    def write(self, f: TextIO) -> None:
+        """Write the configuration in INI format to an open file object"""
+        for section, options in self._data.items():
+            f.write(f"[{section}]\n")
+            for option, value in options.items():
+                if value is None:
+                    f.write(f"{option}\n")
+                else:
+                    value = str(value).replace('\n', '\n\t')
+                    f.write(f"{option} = {value}\n")
+            f.write("\n")
+
+    def __contains__(self, section: str) -> bool:
+        return section in self._data
+
+    def __getitem__(self, section: str) -> Dict[str, Optional[str]]:
+        return self._data[section]
+
+    def __setitem__(self, section: str, options: Dict[str, Any]) -> None:
+        self._data[section] = {k.lower(): str(v) for k, v in options.items()}
+
 
 class ConfigManager:
     """Handles loading and accessing configuration settings"""
     
+    __slots__ = ('config', 'config_file', 'logger', '_use_defaults', '_settings_cache', '_target_dirs',
+                 '_loaded_stamp')
+    
+    # Default configuration used if no file is found
+    _DEFAULTS: Dict[str, Dict[str, str]] = {
+        'Server': {
+            'host': '0.0.0.0',
+            'port': '8443',
+            'key': 'OHSNAP'
+        },
+        'Certificates': {
+            'ca_cert': 'palioxis-ca.crt',
+            'server_cert': 'palioxis-server.crt',
+            'server_key': 'palioxis-server.key',
+            'client_cert': 'palioxis-client.crt',
+            'client_key': 'palioxis-client.key'
+        },
+        'Destroyer': {
+            'module': 'fast',
+            'fast_passes': '3',
+            'shred_passes': '9'
+        },
+        'Daemon': {
+            'log_file': 'palioxis.log',
+            'log_level': 'INFO'
+        },
+        'Targets': {},
+        'Client': {
+            'nodes_list': 'nodes.txt'
+        }
+    }
+    
     def __init__(self, config_file_path: Optional[str] = None):
         """Initialize with optional explicit config file path"""
-        self.config = configparser.ConfigParser(allow_no_value=True)
+        self.config = FastConfigParser()
         self.config_file = config_file_path
         self.logger = logging.getLogger('palioxis.config')
+        self._use_defaults = False
+        # Settings dictionaries built on first access, cleared on update();
+        # callers get copies so they cannot change what later callers see
+        self._settings_cache: Dict[str, Dict[str, Any]] = {}
+        self._target_dirs: Optional[List[str]] = None
+        # (path, mtime_ns, size) of the last file parsed, to skip re-reading it unchanged
+        self._loaded_stamp: Optional[tuple] = None
         
     def load_config(self) -> bool:
         """Load the configuration file"""
@@ -32,118 +187,133 @@ class ConfigManager:
         
         config_found = False
         for path in search_paths:
+            # Open directly instead of stat-ing first; a missing file just
+            # moves on to the next search path
             try:
-                if os.path.exists(path):
-                    self.logger.info(f"Loading configuration from {path}")
-                    self.config.read(path)
-                    self.config_file = path
-                    config_found = True
-                    break
+                with open(path, 'r') as f:
+                    st = os.fstat(f.fileno())
+                    stamp = (path, st.st_mtime_ns, st.st_size)
+                    if stamp == self._loaded_stamp:
+                        self.logger.debug("Configuration %s unchanged, not re-reading", path)
+                    else:
+                        self.logger.info("Loading configuration from %s", path)
+                        self._settings_cache.clear()
+                        self._target_dirs = None
+                        self.config.read_file(f)
+                        self._loaded_stamp = stamp
+                self.config_file = path
+                config_found = True
+                break
+            except FileNotFoundError:
+                continue
             except Exception as e:
-                self.logger.error(f"Error loading configuration from {path}: {e}")
+                self.logger.error("Error loading configuration from %s: %s", path, e)
                 
         if not config_found:
+            self._settings_cache.clear()
+            self._target_dirs = None
+            self._loaded_stamp = None
             self.logger.warning("No configuration file found, using defaults")
-            self._create_default_config()
+            # Default sections are created lazily, on first access
+            self._use_defaults = True
             
         return config_found
     
-    def _create_default_config(self) -> None:
-        """Create a default configuration if no file is found"""
-        # Set up default sections
-        self.config['Server'] = {
-            'host': '0.0.0.0',
-            'port': '8443',
-            'key': 'OHSNAP'
-        }
-        self.config['Certificates'] = {
-            'ca_cert': 'palioxis-ca.crt',
-            'server_cert': 'palioxis-server.crt',
-            'server_key': 'palioxis-server.key',
-            'client_cert': 'palioxis-client.crt',
-            'client_key': 'palioxis-client.key'
-        }
-        self.config['Destroyer'] = {
-            'module': 'fast',
-            'fast_passes': '3',
-            'shred_passes': '9'
-        }
-        self.config['Daemon'] = {
-            'log_file': 'palioxis.log',
-            'log_level': 'INFO'
-        }
-        self.config['Targets'] = {}
-        self.config['Client'] = {
-            'nodes_list': 'nodes.txt'
-        }
+    def _materialize_default(self, section: str) -> bool:
+        """Create a default section on first access when running without a config file"""
+        if not self._use_defaults or section not in self._DEFAULTS or self.config.has_section(section):
+            return False
+        self.config[section] = self._DEFAULTS[section]
+        return True
+    
+    def _lookup(self, getter, section: str, option: str):
+        """Call a parser getter, materializing the default section if it is missing"""
+        try:
+            return getter(section, option)
+        except KeyError:
+            if not self._materialize_default(section):
+                raise
+            return getter(section, option)
     
     def save_config(self, path: Optional[str] = None) -> bool:
         """Save current configuration to a file"""
         save_path = path or self.config_file or 'palioxis.conf'
+        # Write out every default section, not just the ones accessed so far
+        for section in self._DEFAULTS:
+            self._materialize_default(section)
         try:
             with open(save_path, 'w') as configfile:
                 self.config.write(configfile)
-            self.logger.info(f"Configuration saved to {save_path}")
+            self.logger.info("Configuration saved to %s", save_path)
             return True
         except Exception as e:
-            self.logger.error(f"Failed to save configuration to {save_path}: {e}")
+            self.logger.error("Failed to save configuration to %s: %s", save_path, e)
             return False
         
     def get(self, section: str, option: str, default: Any = None) -> str:
         """Get a configuration value, with a default if not found"""
         try:
-            return self.config.get(section, option)
-        except (configparser.NoSectionError, configparser.NoOptionError):
+            return self._lookup(self.config.get, section, option)
+        except KeyError:
             return default
             
     def get_int(self, section: str, option: str, default: int = 0) -> int:
         """Get an integer configuration value, with a default if not found"""
         try:
-            return self.config.getint(section, option)
-        except (configparser.NoSectionError, configparser.NoOptionError, ValueError):
+            return self._lookup(self.config.getint, section, option)
+        except (KeyError, TypeError, ValueError):
             return default
             
     def get_bool(self, section: str, option: str, default: bool = False) -> bool:
         """Get a boolean configuration value, with a default if not found"""
         try:
-            return self.config.getboolean(section, option)
-        except (configparser.NoSectionError, configparser.NoOptionError, ValueError):
+            return self._lookup(self.config.getboolean, section, option)
+        except (KeyError, TypeError, ValueError):
             return default
             
     def get_float(self, section: str, option: str, default: float = 0.0) -> float:
         """Get a float configuration value, with a default if not found"""
         try:
-            return self.config.getfloat(section, option)
-        except (configparser.NoSectionError, configparser.NoOptionError, ValueError):
+            return self._lookup(self.config.getfloat, section, option)
+        except (KeyError, TypeError, ValueError):
             return default
             
     def get_list(self, section: str, option: str) -> List[str]:
         """Get a list of values from a multi-line configuration option"""
         try:
-            value = self.config.get(section, option)
+            value = self._lookup(self.config.get, section, option)
             return [line.strip() for line in value.strip().split('\n') if line.strip()]
-        except (configparser.NoSectionError, configparser.NoOptionError):
+        except KeyError:
             return []
             
     def get_target_directories(self) -> List[str]:
         """Get the list of target directories for destruction"""
+        if self._target_dirs is None:
+            self._target_dirs = self._load_target_directories()
+        # Hand out a copy so callers cannot modify the cached list
+        return list(self._target_dirs)
+            
+    def _load_target_directories(self) -> List[str]:
+        """Read the target directories from the config or from targets.txt"""
         try:
             if self.config.has_option('Targets', 'directories'):
                 return self.get_list('Targets', 'directories')
             
             # If no directories in config, try to read from targets.txt
-            if os.path.exists('targets.txt'):
+            try:
                 with open('targets.txt', 'r') as f:
-                    return [line.strip() for line in f.readlines() if line.strip()]
-            
-            return []
+                    return [line.strip() for line in f if line.strip()]
+            except FileNotFoundError:
+                return []
         except Exception as e:
-            self.logger.error(f"Error getting target directories: {e}")
+            self.logger.error("Error getting target directories: %s", e)
             return []
             
     def get_server_settings(self) -> Dict[str, Any]:
         """Get all server-related settings as a dictionary"""
-        return {
+        if 'server' in self._settings_cache:
+            return dict(self._settings_cache['server'])
+        settings = self._settings_cache['server'] = {
             'host': self.get('Server', 'host', '0.0.0.0'),
             'port': self.get_int('Server', 'port', 8443),
             'key': self.get('Server', 'key', 'OHSNAP'),
@@ -151,33 +321,50 @@ class ConfigManager:
             'server_cert': self.get('Certificates', 'server_cert', 'palioxis-server.crt'),
             'server_key': self.get('Certificates', 'server_key', 'palioxis-server.key')
         }
+        return dict(settings)
         
     def get_client_settings(self) -> Dict[str, Any]:
         """Get all client-related settings as a dictionary"""
-        return {
+        if 'client' in self._settings_cache:
+            return dict(self._settings_cache['client'])
+        settings = self._settings_cache['client'] = {
             'nodes_list': self.get('Client', 'nodes_list', 'nodes.txt'),
             'ca_cert': self.get('Certificates', 'ca_cert', 'palioxis-ca.crt'),
             'client_cert': self.get('Certificates', 'client_cert', 'palioxis-client.crt'),
-            'client_key': self.get('Certificates', 'client_key', 'palioxis-client.key')
+            'client_key': self.get('Certificates', 'client_key', 'palioxis-client.key'),
+            'workers': self.get_int('Client', 'workers', 0)
         }
+        return dict(settings)
         
     def get_destroyer_settings(self) -> Dict[str, Any]:
         """Get all destroyer-related settings as a dictionary"""
-        return {
+        if 'destroyer' in self._settings_cache:
+            return dict(self._settings_cache['destroyer'])
+        settings = self._settings_cache['destroyer'] = {
             'module': self.get('Destroyer', 'module', 'fast'),
             'fast_passes': self.get_int('Destroyer', 'fast_passes', 3),
-            'shred_passes': self.get_int('Destroyer', 'shred_passes', 9)
+            'shred_passes': self.get_int('Destroyer', 'shred_passes', 9),
+            'workers': self.get_int('Destroyer', 'workers', 0),
+            'overwrite_small_files': self.get_bool('Destroyer', 'overwrite_small_files', True)
         }
+        return dict(settings)
         
     def get_daemon_settings(self) -> Dict[str, Any]:
         """Get all daemon-related settings as a dictionary"""
-        return {
+        if 'daemon' in self._settings_cache:
+            return dict(self._settings_cache['daemon'])
+        settings = self._settings_cache['daemon'] = {
             'log_file': self.get('Daemon', 'log_file', 'palioxis.log'),
             'log_level': self.get('Daemon', 'log_level', 'INFO')
         }
+        return dict(settings)
 
     def update(self, section: str, option: str, value: Any) -> None:
         """Update a configuration value"""
+        self._materialize_default(section)
         if not self.config.has_section(section):
             self.config.add_section(section)
         self.config.set(section, option, str(value))
+        self._settings_cache.clear()
+        if section == 'Targets':
+            self._target_dirs = None
@@ -4,218 +4,553 @@
 
 import os
 import abc
+import stat
 import subprocess
 import logging
 import platform
-from typing import List, Optional
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import List, Optional, Tuple
+
+# Settings used when a destroyer is created without a ConfigManager; these
+# mirror the defaults of ConfigManager.get_destroyer_settings()
+DEFAULT_SETTINGS = {
+    'module': 'fast',
+    'fast_passes': 3,
+    'shred_passes': 9,
+    'workers': 0,
+    'overwrite_small_files': True
+}
+
+# Files below this size fit in a single filesystem block
+SMALL_FILE_SIZE = 4096
+
+# Whether files can be opened and unlinked relative to a directory descriptor
+_HAVE_DIR_FD = os.open in os.supports_dir_fd and os.unlink in os.supports_dir_fd
+
+# Page cache hints are only available on POSIX systems
+_HAVE_FADVISE = hasattr(os, 'posix_fadvise')
+
+# Argument bytes a single command batch may use; a quarter of ARG_MAX leaves
+# room for the environment and the rest of the command line
+try:
+    _BATCH_ARG_BYTES = os.sysconf('SC_ARG_MAX') // 4
+except (AttributeError, ValueError, OSError):
+    _BATCH_ARG_BYTES = 32 * 1024
+
+# Flags used to open files for overwriting; O_NOATIME is Linux only
+_OVERWRITE_FLAGS = os.O_WRONLY | getattr(os, 'O_NOATIME', 0)
+
+
+def _volume_root(path: str) -> str:
+    """Mount point of the volume holding path, after resolving symlinks"""
+    path = os.path.realpath(path)
+    while not os.path.ismount(path):
+        parent = os.path.dirname(path)
+        if parent == path:
+            break
+        path = parent
+    return path
+
+
+def _write_all(fd: int, data: memoryview) -> None:
+    """Write the whole buffer to fd, continuing after short writes"""
+    written = 0
+    while written < len(data):
+        written += os.write(fd, data[written:])
+
 
 class BaseDestroyer(abc.ABC):
     """Abstract base class for all destroyer implementations"""
     
+    __slots__ = ('config', 'logger', 'workers', 'overwrite_small_files')
+    
+    # Maximum number of files from one directory handled by a single worker task
+    GROUP_SIZE = 64
+    
     def __init__(self, config=None):
-        self.config = config or {}
+        # Typed settings as returned by ConfigManager.get_destroyer_settings();
+        # keys missing from a hand-built dictionary fall back to the defaults
+        self.config = {**DEFAULT_SETTINGS, **(config or {})}
         self.logger = logging.getLogger('palioxis.destroyer')
+        # Number of files destroyed concurrently; destruction is I/O bound
+        self.workers = self.config['workers'] or min(32, (os.cpu_count() or 1) * 2)
+        self.overwrite_small_files = self.config['overwrite_small_files']
+    
+    def _skip_overwrite(self, file_size: int) -> bool:
+        """Whether a file of this size can simply be unlinked without overwriting"""
+        return file_size == 0 or (file_size < SMALL_FILE_SIZE and not self.overwrite_small_files)
     
     @abc.abstractmethod
     def destroy_file(self, filepath: str) -> bool:
         """Destroy a single file securely"""
         pass
     
+    def destroy_file_at(self, entry: os.DirEntry, dir_fd: Optional[int]) -> bool:
+        """Destroy a regular file found while scanning a directory open as dir_fd"""
+        return self.destroy_file(entry.path)
+    
+    def _destroy_group(self, dirpath: str, entries: List[os.DirEntry]) -> bool:
+        """Destroy files from one directory through a single directory descriptor"""
+        dir_fd = None
+        if _HAVE_DIR_FD:
+            try:
+                dir_fd = os.open(dirpath, os.O_RDONLY | os.O_DIRECTORY | os.O_NOFOLLOW)
+            except OSError as e:
+                self.logger.error("Failed to open directory %s: %s", dirpath, e)
+                return False
+        
+        success = True
+        try:
+            for entry in entries:
+                if not self.destroy_file_at(entry, dir_fd):
+                    self.logger.error("Failed to destroy file: %s", entry.path)
+                    success = False
+        finally:
+            if dir_fd is not None:
+                os.close(dir_fd)
+        return success
+    
+    def _destroy_groups(self, groups: List[Tuple[str, List[os.DirEntry]]]) -> bool:
+        """Destroy scanned files grouped by directory, spreading them over a thread pool"""
+        # Split large directories so their files can still be spread over workers
+        tasks = [(dirpath, entries[i:i + self.GROUP_SIZE])
+                 for dirpath, entries in groups
+                 for i in range(0, len(entries), self.GROUP_SIZE)]
+        if self.workers <= 1 or len(tasks) <= 1:
+            return all([self._destroy_group(dirpath, entries) for dirpath, entries in tasks])
+        
+        with ThreadPoolExecutor(max_workers=min(self.workers, len(tasks))) as executor:
+            futures = [executor.submit(self._destroy_group, dirpath, entries) for dirpath, entries in tasks]
+            return all([future.result() for future in as_completed(futures)])
+    
     def destroy_dir(self, dirpath: str) -> bool:
         """Recursively destroy all files in a directory"""
         try:
-            self.logger.info(f"Starting destruction of directory: {dirpath}")
+            self.logger.info("Starting destruction of directory: %s", dirpath)
             success = True
             
-            for root, dirs, files in os.walk(dirpath, topdown=False):
-                # First destroy all files in the directory
-                for file in files:
-                    full_path = os.path.join(root, file)
-                    if not self.destroy_file(full_path):
-                        self.logger.error(f"Failed to destroy file: {full_path}")
-                        success = False
+            # A configured target may be a symlink to a directory; walk what it
+            # points at, since the descriptors below are opened with O_NOFOLLOW
+            dirpath = os.path.realpath(dirpath)
+            
+            # Walk the tree with scandir so file types come from the directory
+            # entries themselves rather than from a stat() per file
+            pending = [dirpath]
+            subdirs = []
+            groups = []
+            while pending:
+                current = pending.pop()
+                try:
+                    with os.scandir(current) as it:
+                        entries = list(it)
+                except OSError as e:
+                    self.logger.error("Failed to scan directory %s: %s", current, e)
+                    success = False
+                    continue
                 
-                # Then try to remove the empty directories
-                for dir in dirs:
-                    try:
-                        full_dir = os.path.join(root, dir)
-                        os.rmdir(full_dir)
-                        self.logger.debug(f"Removed directory: {full_dir}")
-                    except OSError as e:
-                        self.logger.error(f"Failed to remove directory {full_dir}: {e}")
-                        success = False
+                files = []
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+                        subdirs.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        files.append(entry)
+                    else:
+                        # Symlinks and special files are unlinked, never followed
+                        try:
+                            os.unlink(entry.path)
+                        except OSError as e:
+                            self.logger.error("Failed to remove %s: %s", entry.path, e)
+                            success = False
+                if files:
+                    groups.append((current, files))
+            
+            # Destroy the collected files concurrently
+            if not self._destroy_groups(groups):
+                success = False
+            
+            # Then remove the emptied directories, deepest first
+            for full_dir in reversed(subdirs):
+                try:
+                    os.rmdir(full_dir)
+                    self.logger.debug("Removed directory: %s", full_dir)
+                except OSError as e:
+                    self.logger.error("Failed to remove directory %s: %s", full_dir, e)
+                    success = False
             
             # Finally try to remove the root directory itself
             try:
                 os.rmdir(dirpath)
-                self.logger.debug(f"Removed root directory: {dirpath}")
+                self.logger.debug("Removed root directory: %s", dirpath)
             except OSError as e:
-                self.logger.error(f"Failed to remove root directory {dirpath}: {e}")
+                self.logger.error("Failed to remove root directory %s: %s", dirpath, e)
                 success = False
                 
             return success
         except Exception as e:
-            self.logger.error(f"Error destroying directory {dirpath}: {e}")
+            self.logger.error("Error destroying directory %s: %s", dirpath, e)
             return False
     
     def destroy_paths(self, paths: List[str]) -> bool:
         """Destroy a list of files or directories"""
         overall_success = True
         for path in paths:
-            if not path or not os.path.exists(path):
-                self.logger.warning(f"Path does not exist: {path}")
+            if not path:
+                self.logger.warning("Path does not exist: %s", path)
                 continue
                 
             try:
-                if os.path.isfile(path):
+                # One lstat() per path; only configured symlinks need a second
+                # stat() to find out what they point at
+                try:
+                    st = os.lstat(path)
+                    if stat.S_ISLNK(st.st_mode):
+                        st = os.stat(path)
+                except (FileNotFoundError, NotADirectoryError):
+                    self.logger.warning("Path does not exist: %s", path)
+                    continue
+                    
+                if stat.S_ISREG(st.st_mode):
                     if not self.destroy_file(path):
                         overall_success = False
-                elif os.path.isdir(path):
+                elif stat.S_ISDIR(st.st_mode):
                     if not self.destroy_dir(path):
                         overall_success = False
                 else:
-                    self.logger.warning(f"Path is neither file nor directory: {path}")
+                    self.logger.warning("Path is neither file nor directory: %s", path)
             except Exception as e:
-                self.logger.error(f"Error processing path {path}: {e}")
+                self.logger.error("Error processing path %s: %s", path, e)
                 overall_success = False
                 
         return overall_success
 
 
-class ShredDestroyer(BaseDestroyer):
+class CommandDestroyer(BaseDestroyer):
+    """Base class for destroyers that delegate to an external command"""
+    
+    __slots__ = ()
+    
+    # Maximum number of files passed to a single command invocation
+    BATCH_SIZE = 1000
+    
+    @abc.abstractmethod
+    def _command(self, paths: List[str]) -> List[str]:
+        """Build the command line that destroys the given files"""
+        pass
+    
+    def _batches(self, paths: List[str]) -> List[List[str]]:
+        """Split paths into batches bounded by BATCH_SIZE and the argument size limit"""
+        batches = []
+        batch = []
+        batch_bytes = 0
+        for path in paths:
+            # Each argument costs its encoded length, a NUL and an argv pointer
+            path_bytes = len(os.fsencode(path)) + 9
+            if batch and (len(batch) >= self.BATCH_SIZE or batch_bytes + path_bytes > _BATCH_ARG_BYTES):
+                batches.append(batch)
+                batch = []
+                batch_bytes = 0
+            batch.append(path)
+            batch_bytes += path_bytes
+        if batch:
+            batches.append(batch)
+        return batches
+    
+    def _destroy_batch(self, paths: List[str]) -> bool:
+        """Run the command once for a batch of files, retrying failures one by one"""
+        try:
+            result = subprocess.run(self._command(paths), check=False)
+        except Exception as e:
+            self.logger.error("Error running batch destroy command: %s", e)
+            result = None
+        if result is not None and result.returncode == 0:
+            return True
+        
+        # Files that are still present failed; retry them individually so
+        # each failure gets reported through destroy_file
+        success = True
+        for path in paths:
+            if os.path.lexists(path) and not self.destroy_file(path):
+                success = False
+        return success
+    
+    def _destroy_groups(self, groups: List[Tuple[str, List[os.DirEntry]]]) -> bool:
+        """Destroy scanned files in batches, one command invocation per batch"""
+        paths = []
+        success = True
+        for _, entries in groups:
+            for entry in entries:
+                try:
+                    if self._skip_overwrite(entry.stat(follow_symlinks=False).st_size):
+                        # Nothing worth running the command for
+                        os.unlink(entry.path)
+                        continue
+                except OSError as e:
+                    self.logger.error("Failed to remove %s: %s", entry.path, e)
+                    success = False
+                    continue
+                paths.append(entry.path)
+                
+        batches = self._batches(paths)
+        if self.workers <= 1 or len(batches) <= 1:
+            return all([self._destroy_batch(batch) for batch in batches]) and success
+        
+        with ThreadPoolExecutor(max_workers=min(self.workers, len(batches))) as executor:
+            results = list(executor.map(self._destroy_batch, batches))
+        return all(results) and success
+
+
+class ShredDestroyer(CommandDestroyer):
     """Destroyer implementation using the 'shred' command"""
     
+    __slots__ = ('passes',)
+    
     def __init__(self, config=None):
         super().__init__(config)
-        self.passes = int(self.config.get('shred_passes', 9))
+        self.passes = self.config['shred_passes']
+        
+    def _command(self, paths: List[str]) -> List[str]:
+        return ['shred', '-n', str(self.passes), '-z', '-f', '-u', *paths]
         
     def destroy_file(self, filepath: str) -> bool:
         """Securely destroy a file using the shred command"""
         try:
-            self.logger.debug(f"Shredding file: {filepath}")
-            cmd = ['shred', '-n', str(self.passes), '-z', '-f', '-u', filepath]
-            subprocess.run(cmd, check=True)
-            self.logger.debug(f"Successfully shredded file: {filepath}")
+            if self._skip_overwrite(os.stat(filepath).st_size):
+                # Just delete empty (and, if configured, tiny) files
+                os.remove(filepath)
+                return True
+            self.logger.debug("Shredding file: %s", filepath)
+            subprocess.run(self._command([filepath]), check=True)
+            self.logger.debug("Successfully shredded file: %s", filepath)
             return True
         except subprocess.CalledProcessError as e:
-            self.logger.error(f"Shred command failed for {filepath}: {e}")
+            self.logger.error("Shred command failed for %s: %s", filepath, e)
             return False
         except Exception as e:
-            self.logger.error(f"Error shredding file {filepath}: {e}")
+            self.logger.error("Error shredding file %s: %s", filepath, e)
             return False
 
 
 class FastDestroyer(BaseDestroyer):
     """Fast destroyer implementation using Python's native file operations"""
     
+    __slots__ = ('passes', '_local')
+    
+    # Size of the write buffer used for each overwrite pass
+    CHUNK_SIZE = 4 * 1024 * 1024
+    
     def __init__(self, config=None):
         super().__init__(config)
-        self.passes = int(self.config.get('fast_passes', 3))
+        self.passes = self.config['fast_passes']
+        # Write buffers are kept per worker thread
+        self._local = threading.local()
+        
+    def _buffer(self, size: int) -> memoryview:
+        """Return this thread's reusable write buffer, grown to at least size bytes"""
+        buf = getattr(self._local, 'buf', None)
+        if buf is None or len(buf) < size:
+            buf = self._local.buf = memoryview(bytearray(size))
+        return buf
+        
+    def _fill_random(self, view: memoryview) -> None:
+        """Fill a buffer with random bytes from the kernel CSPRNG"""
+        # os.urandom uses getrandom() where available, so no descriptor is
+        # left open in each worker thread
+        view[:] = os.urandom(len(view))
         
     def destroy_file(self, filepath: str) -> bool:
         """Overwrite file with random data and then delete it"""
         try:
-            if not os.path.exists(filepath) or not os.path.isfile(filepath):
-                self.logger.warning(f"File does not exist: {filepath}")
+            # A single stat() gives existence, type and size
+            try:
+                st = os.stat(filepath)
+            except (FileNotFoundError, NotADirectoryError):
+                st = None
+            if st is None or not stat.S_ISREG(st.st_mode):
+                self.logger.warning("File does not exist: %s", filepath)
                 return True  # Not an error if file doesn't exist
             
-            # Get the file size
-            file_size = os.path.getsize(filepath)
-            if file_size == 0:
-                # Just delete empty files
-                os.remove(filepath)
-                return True
-                
-            self.logger.debug(f"Fast destroying file: {filepath} ({file_size} bytes)")
+            return self._overwrite_and_remove(filepath, st.st_size)
+        except Exception as e:
+            self.logger.error("Error fast-destroying file %s: %s", filepath, e)
+            return False
+    
+    def destroy_file_entry(self, entry: os.DirEntry, dir_fd: Optional[int] = None) -> bool:
+        """Destroy a file from a scandir entry, reusing its cached metadata"""
+        try:
+            name = entry.name if dir_fd is not None else entry.path
+            return self._overwrite_and_remove(name, entry.stat(follow_symlinks=False).st_size,
+                                              dir_fd, entry.path)
+        except Exception as e:
+            self.logger.error("Error fast-destroying file %s: %s", entry.path, e)
+            return False
+    
+    def destroy_file_at(self, entry: os.DirEntry, dir_fd: Optional[int]) -> bool:
+        return self.destroy_file_entry(entry, dir_fd)
+        
+    def _overwrite_and_remove(self, filepath: str, file_size: int,
+                              dir_fd: Optional[int] = None, display_path: Optional[str] = None) -> bool:
+        """Overwrite a regular file of known size with random data and delete it
+        
+        With dir_fd, filepath is a name relative to that open directory, which
+        avoids resolving the full path again for the open and the unlink.
+        """
+        display_path = display_path or filepath
+        if self._skip_overwrite(file_size):
+            # Just delete empty (and, if configured, tiny) files
+            os.remove(filepath, dir_fd=dir_fd)
+            return True
             
-            # Perform the overwrite passes
+        self.logger.debug("Fast destroying file: %s (%d bytes)", display_path, file_size)
+        
+        # Open once and overwrite in place on every pass, reusing one buffer
+        chunk_size = min(self.CHUNK_SIZE, file_size)
+        view = self._buffer(chunk_size)
+        # No O_TRUNC: the random data has to land on the file's existing blocks
+        try:
+            fd = os.open(filepath, _OVERWRITE_FLAGS, dir_fd=dir_fd)
+        except PermissionError:
+            if _OVERWRITE_FLAGS == os.O_WRONLY:
+                raise
+            # O_NOATIME is refused for files we do not own
+            fd = os.open(filepath, os.O_WRONLY, dir_fd=dir_fd)
+        try:
+            if _HAVE_FADVISE:
+                # The overwritten pages are never read back
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_NOREUSE)
             for i in range(self.passes):
-                with open(filepath, 'wb') as f:
-                    # Write in chunks to handle large files
-                    chunk_size = min(1024 * 1024, file_size)  # 1MB chunks or file size
-                    remaining = file_size
+                os.lseek(fd, 0, os.SEEK_SET)
+                if file_size == chunk_size:
+                    # Most files fit in one buffer: one fill and one write per pass
+                    self._fill_random(view[:file_size])
+                    _write_all(fd, view[:file_size])
+                    continue
                     
-                    while remaining > 0:
-                        write_size = min(chunk_size, remaining)
-                        f.write(os.urandom(write_size))
-                        remaining -= write_size
-            
-            # Delete the file after overwriting
-            os.remove(filepath)
-            self.logger.debug(f"Successfully destroyed file: {filepath}")
-            return True
-        except Exception as e:
-            self.logger.error(f"Error fast-destroying file {filepath}: {e}")
-            return False
+                remaining = file_size
+                while remaining > 0:
+                    write_size = min(chunk_size, remaining)
+                    self._fill_random(view[:write_size])
+                    _write_all(fd, view[:write_size])
+                    remaining -= write_size
+            os.fsync(fd)
+            # Release the overwritten blocks only once the last pass is on disk
+            os.ftruncate(fd, 0)
+            if _HAVE_FADVISE:
+                # Evict the now clean pages, the file is about to be removed
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        finally:
+            os.close(fd)
+        
+        # Delete the file after overwriting
+        os.remove(filepath, dir_fd=dir_fd)
+        self.logger.debug("Successfully destroyed file: %s", display_path)
+        return True
 
 
-class WipeDestroyer(BaseDestroyer):
+class WipeDestroyer(CommandDestroyer):
     """Destroyer implementation using the 'wipe' command"""
     
+    __slots__ = ()
+    
+    def _command(self, paths: List[str]) -> List[str]:
+        return ['wipe', '-rf', *paths]
+    
     def destroy_file(self, filepath: str) -> bool:
         """Securely destroy a file using the wipe command"""
         try:
-            self.logger.debug(f"Wiping file: {filepath}")
-            cmd = ['wipe', '-rf', filepath]
-            subprocess.run(cmd, check=True)
-            self.logger.debug(f"Successfully wiped file: {filepath}")
+            if self._skip_overwrite(os.stat(filepath).st_size):
+                # Just delete empty (and, if configured, tiny) files
+                os.remove(filepath)
+                return True
+            self.logger.debug("Wiping file: %s", filepath)
+            subprocess.run(self._command([filepath]), check=True)
+            self.logger.debug("Successfully wiped file: %s", filepath)
             return True
         except subprocess.CalledProcessError as e:
-            self.logger.error(f"Wipe command failed for {filepath}: {e}")
+            self.logger.error("Wipe command failed for %s: %s", filepath, e)
             return False
         except Exception as e:
-            self.logger.error(f"Error wiping file {filepath}: {e}")
+            self.logger.error("Error wiping file %s: %s", filepath, e)
             return False
 
 
 class WindowsDestroyer(BaseDestroyer):
     """Destroyer implementation for Windows systems"""
     
+    __slots__ = ()
+    
     def destroy_file(self, filepath: str) -> bool:
         """Securely destroy a file using Windows-specific methods"""
         try:
-            self.logger.debug(f"Destroying file with Windows method: {filepath}")
+            self.logger.debug("Destroying file with Windows method: %s", filepath)
             
             # First overwrite the file
-            file_size = os.path.getsize(filepath)
-            if file_size > 0:
-                with open(filepath, 'wb') as f:
+            st = os.stat(filepath)
+            if not stat.S_ISREG(st.st_mode):
+                self.logger.warning("Not a regular file: %s", filepath)
+                return True
+            file_size = st.st_size
+            if not self._skip_overwrite(file_size):
+                # r+b rather than wb: truncating first could let the random
+                # data land on newly allocated clusters instead of the old ones
+                with open(filepath, 'r+b') as f:
                     f.write(os.urandom(file_size))
+                    f.flush()
+                    os.fsync(f.fileno())
             
-            # Then use the cipher command if available
-            try:
-                dir_path = os.path.dirname(filepath)
-                cmd = ['cipher', '/w:' + dir_path]
-                subprocess.run(cmd, check=True)
-            except subprocess.SubprocessError:
-                self.logger.warning("Cipher command failed, falling back to basic deletion")
-                
-            # Finally remove the file
+            # Then remove the file; free space is wiped once per volume
             os.remove(filepath)
-            self.logger.debug(f"Successfully destroyed file: {filepath}")
+            self.logger.debug("Successfully destroyed file: %s", filepath)
             return True
         except Exception as e:
-            self.logger.error(f"Error destroying file with Windows method {filepath}: {e}")
+            self.logger.error("Error destroying file with Windows method %s: %s", filepath, e)
             return False
+    
+    def destroy_paths(self, paths: List[str]) -> bool:
+        """Destroy a list of files or directories, then wipe each volume's free space once"""
+        # Find the volumes while the targets still exist; symlinked targets
+        # count for the volume they point into
+        volumes = {_volume_root(path) for path in paths if path and os.path.exists(path)}
+        success = super().destroy_paths(paths)
+        
+        # cipher /w wipes all free space on the volume holding the given
+        # directory, so one run per volume covers every destroyed file
+        for volume in sorted(volumes):
+            try:
+                subprocess.run(['cipher', '/w:' + volume], check=True)
+            except (OSError, subprocess.SubprocessError):
+                self.logger.warning("Cipher command failed for %s, falling back to basic deletion", volume)
+                
+        return success
+
+
+# Registry of available destroyer modules
+_DESTROYERS = {
+    'shred': ShredDestroyer,
+    'fast': FastDestroyer,
+    'wipe': WipeDestroyer,
+    'windows': WindowsDestroyer
+}
+
+# The platform cannot change while we are running
+_IS_WINDOWS = platform.system() == 'Windows'
 
 
 def get_destroyer(module_name: str, config=None) -> BaseDestroyer:
-    """Factory function to create the appropriate destroyer instance"""
-    destroyers = {
-        'shred': ShredDestroyer,
-        'fast': FastDestroyer,
-        'wipe': WipeDestroyer,
-        'windows': WindowsDestroyer
-    }
-    
-    if module_name.lower() not in destroyers:
-        logging.warning(f"Destroyer module '{module_name}' not recognized, falling back to 'fast'")
+    """Factory function to create the appropriate destroyer instance
+    
+    config is the typed dictionary from ConfigManager.get_destroyer_settings();
+    any settings it lacks are taken from DEFAULT_SETTINGS.
+    """
+    module_name = module_name.lower()
+    if module_name not in _DESTROYERS:
+        logging.warning("Destroyer module '%s' not recognized, falling back to 'fast'", module_name)
         module_name = 'fast'
         
     # If on Windows and using 'shred' or 'wipe', they won't be available
-    if platform.system() == 'Windows' and module_name.lower() in ['shred', 'wipe']:
-        logging.warning(f"Destroyer module '{module_name}' not available on Windows, using 'windows'")
+    if _IS_WINDOWS and module_name in ('shred', 'wipe'):
+        logging.warning("Destroyer module '%s' not available on Windows, using 'windows'", module_name)
         module_name = 'windows'
         
-    destroyer_class = destroyers[module_name.lower()]
-    return destroyer_class(config)
+    return _DESTROYERS[module_name](config)
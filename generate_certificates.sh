@@ -6,16 +6,16 @@
 echo "[*] Creating Palioxis Certificate Infrastructure..."
 echo "[*] Creating Certificate Authority..."
 
-# Create the CA private key
-openssl genpkey -algorithm RSA -out palioxis-ca.key
+# Create the CA private key (ECDSA P-256: keygen is near-instant compared to RSA)
+openssl genpkey -algorithm EC -pkeyopt ec_paramgen_curve:P-256 -out palioxis-ca.key
 
 # Create a self-signed CA certificate
-openssl req -new -x509 -key palioxis-ca.key -out palioxis-ca.crt -days 3650 \
+openssl req -new -x509 -key palioxis-ca.key -out palioxis-ca.crt -days 3650 -sha256 \
     -subj "/CN=PalioxisInternalCA"
 
 echo "[*] Creating Server Certificate..."
 # Create the server private key
-openssl genpkey -algorithm RSA -out palioxis-server.key
+openssl genpkey -algorithm EC -pkeyopt ec_paramgen_curve:P-256 -out palioxis-server.key
 
 # Create a certificate signing request (CSR) for the server
 openssl req -new -key palioxis-server.key -out palioxis-server.csr \
@@ -23,10 +23,11 @@ openssl req -new -key palioxis-server.key -out palioxis-server.csr \
 
 # Sign the server CSR with your CA
 openssl x509 -req -in palioxis-server.csr -CA palioxis-ca.crt -CAkey palioxis-ca.key \
-    -CAcreateserial -out palioxis-server.crt -days 365
+    -CAcreateserial -out palioxis-server.crt -days 365 -sha256
 
 echo "[*] Creating Client Certificate..."
 # Create the client private key
+# The client key also signs RS256 DPoP proofs, so it must stay RSA
 openssl genpkey -algorithm RSA -out palioxis-client.key
 
 # Create a CSR for the client
@@ -35,7 +36,7 @@ openssl req -new -key palioxis-client.key -out palioxis-client.csr \
 
 # Sign the client CSR with your CA
 openssl x509 -req -in palioxis-client.csr -CA palioxis-ca.crt -CAkey palioxis-ca.key \
-    -CAcreateserial -out palioxis-client.crt -days 365
+    -CAcreateserial -out palioxis-client.crt -days 365 -sha256
 
 echo "[*] Certificate generation complete. You now have:"
 echo "    - palioxis-ca.crt (Certificate Authority)"
@@ -14,23 +14,24 @@ CERT_DIR=$1
 mkdir -p "$CERT_DIR"
 echo "Creating certificates in directory: $CERT_DIR"
 
-# Generate CA key and certificate
-openssl genrsa -out "$CERT_DIR/ca.key" 4096
-openssl req -new -x509 -key "$CERT_DIR/ca.key" -out "$CERT_DIR/ca.crt" -subj "/CN=PalioxisCA" -days 3650
+# Generate CA key and certificate (ECDSA P-256: keygen is near-instant, unlike RSA 4096)
+openssl genpkey -algorithm EC -pkeyopt ec_paramgen_curve:P-256 -out "$CERT_DIR/ca.key"
+openssl req -new -x509 -key "$CERT_DIR/ca.key" -out "$CERT_DIR/ca.crt" -subj "/CN=PalioxisCA" -days 3650 -sha256
 
 # Generate server key and certificate request
-openssl genrsa -out "$CERT_DIR/server.key" 2048
+openssl genpkey -algorithm EC -pkeyopt ec_paramgen_curve:P-256 -out "$CERT_DIR/server.key"
 openssl req -new -key "$CERT_DIR/server.key" -out "$CERT_DIR/server.csr" -subj "/CN=PalioxisServer"
 
 # Sign server certificate with CA
-openssl x509 -req -in "$CERT_DIR/server.csr" -CA "$CERT_DIR/ca.crt" -CAkey "$CERT_DIR/ca.key" -CAcreateserial -out "$CERT_DIR/server.crt" -days 365
+openssl x509 -req -in "$CERT_DIR/server.csr" -CA "$CERT_DIR/ca.crt" -CAkey "$CERT_DIR/ca.key" -CAcreateserial -out "$CERT_DIR/server.crt" -days 365 -sha256
 
 # Generate client key and certificate request
+# The client key also signs RS256 DPoP proofs, so it must stay RSA
 openssl genrsa -out "$CERT_DIR/client.key" 2048
 openssl req -new -key "$CERT_DIR/client.key" -out "$CERT_DIR/client.csr" -subj "/CN=PalioxisClient"
 
 # Sign client certificate with CA
-openssl x509 -req -in "$CERT_DIR/client.csr" -CA "$CERT_DIR/ca.crt" -CAkey "$CERT_DIR/ca.key" -CAcreateserial -out "$CERT_DIR/client.crt" -days 365
+openssl x509 -req -in "$CERT_DIR/client.csr" -CA "$CERT_DIR/ca.crt" -CAkey "$CERT_DIR/ca.key" -CAcreateserial -out "$CERT_DIR/client.crt" -days 365 -sha256
 
 # Clean up CSR files
 rm "$CERT_DIR"/*.csr
@@ -4,53 +4,141 @@
 
 import os
 import sys
+import queue
+import atexit
 import argparse
+import subprocess
 import logging
-import configparser
+import logging.handlers
+import importlib
 import traceback
+from dataclasses import dataclass
 from typing import Dict, List, Any, Optional
 
-# Check for required modules
-try:
-    import jwt
-    import daemon
-    from cryptography.hazmat.primitives import serialization
-    from cryptography.x509 import load_pem_x509_certificate
-except ImportError as e:
-    print(f"[error] Required module not found: {e}")
-    print("[suggestion] Install required dependencies with: pip install pyjwt cryptography python-daemon configparser")
-    print("[suggestion] Consider using a virtual environment: python3 -m venv palioxis_env && source palioxis_env/bin/activate")
-    sys.exit(1)
-
-# Import local modules
+# Import local modules; the server and client are imported on demand so
+# commands that don't need the crypto dependencies start quickly
 from config_manager import ConfigManager
-from destroyers import get_destroyer, BaseDestroyer
-from palioxis_server import PalioxisServer
-from palioxis_client import PalioxisClient
+
+
+def _systemd_escape(value: str) -> str:
+    """Escape % so systemd does not expand it as a unit file specifier"""
+    return value.replace('%', '%%')
+
+
+def _systemd_quote(arg: str) -> str:
+    """Quote one ExecStart argument using systemd's quoting rules"""
+    arg = arg.replace('\\', '\\\\').replace('"', '\\"').replace('$', '$$')
+    return f'"{_systemd_escape(arg)}"'
+
+
+def _check_deps(*modules):
+    """Check that the modules a mode requires can be imported"""
+    try:
+        for module in modules:
+            importlib.import_module(module)
+    except ImportError as e:
+        print(f"[error] Required module not found: {e}")
+        print("[suggestion] Install required dependencies with: pip install pyjwt cryptography python-daemon")
+        print("[suggestion] Consider using a virtual environment: python3 -m venv palioxis_env && source palioxis_env/bin/activate")
+        return False
+    return True
+
+
+# Background listener that writes queued log records
+_log_listener = None
+
+
+def _stop_log_listener():
+    """Flush queued records and stop the log listener"""
+    global _log_listener
+    if _log_listener is not None:
+        _log_listener.stop()
+        _log_listener = None
+
+
+def _restart_log_listener():
+    """Restart the log listener in a forked child such as the daemon"""
+    global _log_listener
+    if _log_listener is None:
+        return
+    # The listener thread does not survive fork and the old queue's lock may
+    # have been held at fork time, so start over with a fresh queue
+    log_queue = queue.Queue(-1)
+    for handler in logging.getLogger('').handlers:
+        if isinstance(handler, logging.handlers.QueueHandler):
+            handler.queue = log_queue
+    _log_listener = logging.handlers.QueueListener(log_queue, *_log_listener.handlers,
+                                                   respect_handler_level=True)
+    _log_listener.start()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_restart_log_listener)
+atexit.register(_stop_log_listener)
+
 
 # Set up logging
 def setup_logging(log_level='INFO', log_file=None):
-    """Configure the logging system"""
+    """Configure the logging system
+    
+    Callers only enqueue records; the handlers run on a background
+    QueueListener thread so logging never blocks on I/O.
+    """
     log_format = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
     numeric_level = getattr(logging, log_level.upper(), logging.INFO)
+    formatter = logging.Formatter(log_format)
     
+    handlers = []
     if log_file:
-        logging.basicConfig(level=numeric_level, format=log_format,
-                           filename=log_file, filemode='a')
-    else:
-        logging.basicConfig(level=numeric_level, format=log_format)
+        file_handler = logging.FileHandler(log_file, mode='a')
+        file_handler.setLevel(numeric_level)
+        file_handler.setFormatter(formatter)
+        handlers.append(file_handler)
+        
+    # Always log to the console as well
+    console = logging.StreamHandler()
+    console.setLevel(numeric_level)
+    console.setFormatter(formatter)
+    handlers.append(console)
     
-    # Add a console handler if logging to file
-    if log_file:
-        console = logging.StreamHandler()
-        console.setLevel(numeric_level)
-        formatter = logging.Formatter(log_format)
-        console.setFormatter(formatter)
-        logging.getLogger('').addHandler(console)
+    # Replace any previous configuration
+    _stop_log_listener()
+    root = logging.getLogger('')
+    for handler in root.handlers[:]:
+        root.removeHandler(handler)
+        
+    log_queue = queue.Queue(-1)
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    root.setLevel(numeric_level)
+    
+    global _log_listener
+    _log_listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _log_listener.start()
         
     return logging.getLogger('palioxis')
 
 
+@dataclass
+class ConfigSnapshot:
+    """Resolved configuration values used by the application"""
+    
+    __slots__ = ('nodes_list', 'log_level', 'log_file')
+    
+    nodes_list: Optional[str]
+    log_level: str
+    log_file: str
+    
+    @classmethod
+    def from_config(cls, config_manager: ConfigManager) -> 'ConfigSnapshot':
+        """Build a snapshot from a loaded ConfigManager"""
+        daemon_settings = config_manager.get_daemon_settings()
+        return cls(
+            nodes_list=config_manager.get('Client', 'nodes_list'),
+            log_level=daemon_settings['log_level'],
+            log_file=daemon_settings['log_file']
+        )
+
+
 class PalioxisApp:
     """Main application class for Palioxis"""
     
@@ -59,6 +147,9 @@ class PalioxisApp:
         self.config_manager = ConfigManager()
         self.logger = logging.getLogger('palioxis.app')
         self.args = None
+        self._cfg = None
+        self._targets = None
+        self._pending_targets = []
         
     def parse_arguments(self):
         """Parse command line arguments"""
@@ -66,7 +157,7 @@ class PalioxisApp:
         parser = argparse.ArgumentParser(description=help_text, prog="palioxis")
         
         # Main mode arguments
-        parser.add_argument('--mode', help='run as client or server', choices=['client', 'server'])
+        parser.add_argument('--mode', help='run as client or server', choices=sorted(self._mode_handlers()))
         parser.add_argument('--config', help='path to configuration file', default=None)
         
         # Server specific arguments
@@ -87,7 +178,8 @@ class PalioxisApp:
         parser.add_argument('--gen-certs', help='generate certificates for mTLS', action='store_true')
         
         # Target management
-        parser.add_argument('--add-target', help='add a directory or file to targets', metavar='PATH')
+        parser.add_argument('--add-target', help='add a directory or file to targets (may be repeated)',
+                            metavar='PATH', action='append')
         
         # Other utilities
         parser.add_argument('--log-level', help='logging level', 
@@ -124,21 +216,36 @@ class PalioxisApp:
         if self.args.log_level:
             self.config_manager.update('Daemon', 'log_level', self.args.log_level)
             
+        self._cfg = ConfigSnapshot.from_config(self.config_manager)
         return True
         
-    def add_target_directory(self, target_path):
-        """Add a target directory or file to the configuration"""
-        if not os.path.exists(target_path):
+    def _target_set(self):
+        """Configured target paths as a set, loaded on first use"""
+        if self._targets is None:
+            self._targets = set(self.config_manager.get_target_directories())
+        return self._targets
+        
+    def add_target_directory(self, target_path, save=True):
+        """Add a target directory or file to the configuration
+        
+        With save=False the path is only added in memory; call save_targets()
+        once after adding several paths.
+        """
+        try:
+            os.stat(target_path)
+        except FileNotFoundError:
             self.logger.error(f"Target path does not exist: {target_path}")
             return False
+        except OSError as e:
+            self.logger.error(f"Cannot access target path {target_path}: {e}")
+            return False
             
-        # First try to update the config file
-        dirs = self.config_manager.get_target_directories()
-        if target_path in dirs:
+        targets = self._target_set()
+        if target_path in targets:
             self.logger.warning(f"Target path already in configuration: {target_path}")
             return False
             
-        dirs.append(target_path)
+        targets.add(target_path)
         
         # Get the existing directories configuration and append the new path
         current_dirs = self.config_manager.get('Targets', 'directories', '')
@@ -149,33 +256,48 @@ class PalioxisApp:
             new_dirs = target_path
             
         self.config_manager.update('Targets', 'directories', new_dirs)
+        self._pending_targets.append(target_path)
+        
+        if not save:
+            return True
+        return self.save_targets()
+        
+    def save_targets(self):
+        """Save the target paths added since the last save"""
+        pending = self._pending_targets
+        if not pending:
+            return True
+        self._pending_targets = []
         
         # Save the updated configuration
         success = self.config_manager.save_config()
         if success:
-            self.logger.info(f"Added target path to configuration: {target_path}")
+            for target_path in pending:
+                self.logger.info(f"Added target path to configuration: {target_path}")
         else:
-            self.logger.error(f"Failed to save configuration with new target path: {target_path}")
+            self.logger.error(f"Failed to save configuration with new target paths: {', '.join(pending)}")
             
             # Fall back to targets.txt if config save fails
             try:
                 with open('targets.txt', 'a') as f:
-                    f.write(f"\n{target_path}")
-                self.logger.info(f"Added target path to targets.txt: {target_path}")
+                    f.write('\n' + '\n'.join(pending))
+                self.logger.info(f"Added target paths to targets.txt: {', '.join(pending)}")
                 success = True
             except Exception as e:
-                self.logger.error(f"Failed to add target path to targets.txt: {e}")
+                self.logger.error(f"Failed to add target paths to targets.txt: {e}")
                 success = False
                 
         return success
         
     def install_daemon(self):
         """Install Palioxis as a systemd service"""
-        settings = self.config_manager.get_server_settings()
-        daemon_settings = self.config_manager.get_daemon_settings()
-        
-        # Get the absolute path to the script
-        script_path = os.path.abspath(__file__)
+        # Pin absolute paths at install time. The interpreter is not passed
+        # through realpath so a virtualenv python keeps its environment
+        python_path = os.path.abspath(sys.executable)
+        script_path = os.path.realpath(__file__)
+        config_path = os.path.realpath(self.config_manager.config_file or 'palioxis.conf')
+        exec_start = (f"{_systemd_quote(python_path)} {_systemd_quote(script_path)} "
+                      f"--mode server --config {_systemd_quote(config_path)}")
         
         # Create the systemd service file content
         service_content = f"""[Unit]
@@ -184,9 +306,9 @@ After=network.target
 
 [Service]
 Type=simple
-ExecStart={sys.executable} {script_path} --mode server --config {self.config_manager.config_file}
+ExecStart={exec_start}
 Restart=on-failure
-WorkingDirectory={os.path.dirname(script_path)}
+WorkingDirectory={_systemd_escape(os.path.dirname(script_path))}
 
 [Install]
 WantedBy=multi-user.target
@@ -195,12 +317,12 @@ WantedBy=multi-user.target
         try:
             # Write the service file
             service_path = '/etc/systemd/system/palioxis.service'
-            with open(service_path, 'w') as f:
-                f.write(service_content)
+            with open(service_path, 'wb') as f:
+                f.write(service_content.encode())
                 
             # Reload systemd and enable the service
-            os.system('systemctl daemon-reload')
-            os.system('systemctl enable palioxis.service')
+            subprocess.run(['systemctl', 'daemon-reload'], check=True)
+            subprocess.run(['systemctl', 'enable', 'palioxis.service'], check=True)
             
             self.logger.info("Palioxis successfully installed as a systemd daemon")
             print("[*] Palioxis installed as a daemon. Use 'systemctl start palioxis' to start it.")
@@ -217,12 +339,12 @@ WantedBy=multi-user.target
         # Check if the certificate generation script exists
         script_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'generate_certificates.sh')
         
-        if not os.path.exists(script_path):
+        # Make the script executable
+        try:
+            os.chmod(script_path, 0o755)
+        except FileNotFoundError:
             print("[error] Certificate generation script not found.")
             return False
-            
-        # Make the script executable
-        os.chmod(script_path, 0o755)
         
         # Run the script
         result = os.system(script_path)
@@ -236,6 +358,11 @@ WantedBy=multi-user.target
 
     def run_server(self, daemonize=False):
         """Start the Palioxis server"""
+        modules = ['cryptography', 'daemon'] if daemonize else ['cryptography']
+        if not _check_deps(*modules):
+            return False
+        from palioxis_server import PalioxisServer
+        
         # Initialize the server
         server = PalioxisServer(self.config_manager)
         
@@ -250,23 +377,22 @@ WantedBy=multi-user.target
     
     def run_client(self):
         """Run the Palioxis client to send signals to servers"""
+        if not _check_deps('jwt', 'cryptography'):
+            return False
+        from palioxis_client import PalioxisClient
+        
         client = PalioxisClient(self.config_manager)
         
         # Get the nodes list file path
-        nodes_list = self.args.list or self.config_manager.get('Client', 'nodes_list')
+        nodes_list = self.args.list or self._cfg.nodes_list
         if not nodes_list:
             self.logger.error("No nodes list file specified")
             print("[error] Missing server list for client mode.")
             print("Usage: ./palioxis.py --mode client --list /path/to/nodes.txt")
             return False
             
-        # Check if the file exists
-        if not os.path.exists(nodes_list):
-            self.logger.error(f"Nodes list file not found: {nodes_list}")
-            print(f"[error] Host list {nodes_list} cannot be found.")
-            return False
-            
-        # Send signals to all servers in the list
+        # Send signals to all servers in the list; a missing file is
+        # reported by the client when it opens the list
         result = client.send_signals_from_file(nodes_list)
         
         # Print the results
@@ -360,14 +486,13 @@ WantedBy=multi-user.target
         self.load_configuration()
         
         # Set up logging
-        daemon_settings = self.config_manager.get_daemon_settings()
-        log_level = self.args.log_level or daemon_settings['log_level']
-        log_file = daemon_settings['log_file'] if self.args.daemon else None
-        setup_logging(log_level, log_file)
+        log_file = self._cfg.log_file if self.args.daemon else None
+        setup_logging(self._cfg.log_level, log_file)
         
-        # Handle target directory addition
+        # Handle target directory addition; the config is saved once for all paths
         if self.args.add_target:
-            return self.add_target_directory(self.args.add_target)
+            added = [self.add_target_directory(path, save=False) for path in self.args.add_target]
+            return self.save_targets() and all(added)
             
         # Install as daemon if requested
         if self.args.install_daemon:
@@ -378,13 +503,18 @@ WantedBy=multi-user.target
             return self.interactive_mode()
             
         # Run in the specified mode
-        if self.args.mode == 'server':
-            return self.run_server(self.args.daemon)
-        elif self.args.mode == 'client':
-            return self.run_client()
-        else:
+        handler = self._mode_handlers().get(self.args.mode)
+        if handler is None:
             print("[error] No valid mode specified. Use --mode server or --mode client")
             return False
+        return handler()
+        
+    def _mode_handlers(self):
+        """Map each --mode value to the method that runs it"""
+        return {
+            'server': lambda: self.run_server(self.args.daemon),
+            'client': self.run_client,
+        }
 
 
 def main():
@@ -2,29 +2,50 @@
 # PROJECT PALIOXIS: Client Class
 # This file contains the client implementation for sending self-destruct signals
 
-import os
 import ssl
+import base64
 import socket
 import logging
 import json
 import time
 import uuid
 import jwt
-from typing import Dict, Any, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional, Tuple
 
 from cryptography.hazmat.primitives import serialization
 from config_manager import ConfigManager
 
 
+def _b64url_uint(value: int) -> str:
+    """Encode an unsigned integer in its minimal big-endian base64url form (RFC 7518)"""
+    data = value.to_bytes((value.bit_length() + 7) // 8 or 1, 'big')
+    return base64.urlsafe_b64encode(data).rstrip(b'=').decode('ascii')
+
+
+def _sendall_chunked(sock: socket.socket, data: bytes, chunk_size: int = 16384) -> None:
+    """Send data in fixed-size slices; some ssl backends slow down on large single writes"""
+    view = memoryview(data)
+    for offset in range(0, len(view), chunk_size):
+        sock.sendall(view[offset:offset + chunk_size])
+
+
 class PalioxisClient:
     """Client class for the Palioxis self-destruct system"""
     
+    # Servers signalled concurrently unless [Client] workers is set
+    MAX_WORKERS = 32
+    
     def __init__(self, config_manager: ConfigManager):
         """Initialize with a ConfigManager instance"""
         self.config_manager = config_manager
         self.logger = logging.getLogger('palioxis.client')
         self.settings = self.config_manager.get_client_settings()
         self.ssl_context = None
+        self._private_key = None
+        self._dpop_headers = None
+        # TLS sessions per server, reused to resume instead of full handshakes
+        self._sessions: Dict[Tuple[str, int], ssl.SSLSession] = {}
         
     def setup_ssl_context(self) -> bool:
         """Set up the SSL context for mTLS"""
@@ -38,29 +59,42 @@ class PalioxisClient:
             # Load the CA certificate to verify the server against
             self.ssl_context.load_verify_locations(cafile=self.settings['ca_cert'])
             
+            # Parse the client key once; it signs the DPoP proof for every server
+            with open(self.settings['client_key'], "rb") as key_file:
+                self._private_key = serialization.load_pem_private_key(key_file.read(), password=None)
+            self._dpop_headers = self._build_dpop_headers(self._private_key)
+            
             self.logger.info("SSL context successfully set up for mTLS")
             return True
         except Exception as e:
             self.logger.error(f"SSL context setup failed: {e}")
             return False
             
+    def _build_dpop_headers(self, private_key) -> Dict[str, Any]:
+        """Build the DPoP JWT header, including the JWK of the client's public key"""
+        numbers = private_key.public_key().public_numbers()
+        
+        # Create the JWK (JSON Web Key) for the header
+        jwk = {
+            "kty": "RSA",
+            "n": _b64url_uint(numbers.n),
+            "e": _b64url_uint(numbers.e),
+        }
+        
+        return {
+            "typ": "dpop+jwt",
+            "alg": "RS256",
+            "jwk": jwk
+        }
+            
     def generate_dpop_proof(self, private_key, http_method: str, http_url: str) -> str:
         """Generate a DPoP proof token for client authentication"""
         try:
-            public_key = private_key.public_key()
-            
-            # Create the JWK (JSON Web Key) for the header
-            jwk = {
-                "kty": "RSA",
-                "n": jwt.utils.base64url_encode(public_key.public_numbers().n.to_bytes(256, 'big')).decode(),
-                "e": jwt.utils.base64url_encode(public_key.public_numbers().e.to_bytes(3, 'big')).decode(),
-            }
-            
-            headers = {
-                "typ": "dpop+jwt",
-                "alg": "RS256",
-                "jwk": jwk
-            }
+            # The header only depends on the key, so reuse it for the client key
+            if private_key is self._private_key and self._dpop_headers is not None:
+                headers = self._dpop_headers
+            else:
+                headers = self._build_dpop_headers(private_key)
             
             payload = {
                 "iat": int(time.time()),
@@ -85,39 +119,47 @@ class PalioxisClient:
             
         try:
             with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+                # The request is a single small write; don't let Nagle delay it
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
                 # Wrap the client socket with the SSL context
-                with self.ssl_context.wrap_socket(sock, server_hostname='palioxis-server') as ssock:
+                with self.ssl_context.wrap_socket(sock, server_hostname='palioxis-server',
+                                                  session=self._sessions.get((host, port))) as ssock:
                     ssock.connect((host, port))
-                    self.logger.info(f"Connected to {host}:{port} with mTLS")
+                    self.logger.info(f"Connected to {host}:{port} with mTLS"
+                                     f"{' (session resumed)' if ssock.session_reused else ''}")
                     
                     # Generate DPoP proof
                     try:
-                        with open(self.settings['client_key'], "rb") as key_file:
-                            key_data = key_file.read()
-                            private_key = serialization.load_pem_private_key(key_data, password=None)
-                        
                         http_url = f"https://{host}:{port}/destroy"
-                        dpop_proof = self.generate_dpop_proof(private_key, "POST", http_url)
+                        dpop_proof = self.generate_dpop_proof(self._private_key, "POST", http_url)
                     except Exception as e:
                         self.logger.error(f"Failed to generate DPoP proof: {e}")
                         return False, f"DPoP proof generation failed: {str(e)}"
                     
-                    # Construct and send the HTTP-like request
-                    request = (
-                        f"POST /destroy HTTP/1.1\r\n"
-                        f"Host: {host}:{port}\r\n"
-                        f"DPoP: {dpop_proof}\r\n"
-                        f"Content-Length: {len(key)}\r\n"
-                        f"\r\n"
-                        f"{key}"
-                    )
+                    # Construct and send the HTTP-like request; the parts are
+                    # encoded individually and joined once
+                    body = key.encode()
+                    if isinstance(dpop_proof, str):
+                        dpop_proof = dpop_proof.encode('ascii')
+                    request = b"".join([
+                        b"POST /destroy HTTP/1.1\r\n",
+                        f"Host: {host}:{port}\r\n".encode('ascii'),
+                        b"DPoP: ", dpop_proof, b"\r\n",
+                        f"Content-Length: {len(body)}\r\n\r\n".encode('ascii'),
+                        body
+                    ])
                     
                     self.logger.debug("Sending destroy request")
-                    ssock.sendall(request.encode())
+                    _sendall_chunked(ssock, request)
                     
                     # Receive and process response
                     response = ssock.recv(1024).decode()
                     
+                    # TLS 1.3 tickets arrive after the handshake, so only
+                    # keep the session once the server has replied
+                    if ssock.session is not None:
+                        self._sessions[(host, port)] = ssock.session
+                    
                     if "200 OK" in response:
                         self.logger.info(f"Signal successfully sent to {host}:{port}")
                         return True, f"Signal accepted by {host}:{port}"
@@ -128,76 +170,78 @@ class PalioxisClient:
             self.logger.error(f"Error sending signal to {host}:{port}: {e}")
             return False, f"Connection error: {str(e)}"
             
+    def send_signals_batch(self, entries: List[Tuple[str, int, str]]) -> List[Dict[str, Any]]:
+        """Send self-destruct signals to several servers concurrently
+        
+        Results are returned in the same order as entries.
+        """
+        if not entries:
+            return []
+            
+        # Set up the shared SSL context once, before fanning out
+        if not self.ssl_context and not self.setup_ssl_context():
+            outcomes = [(False, "SSL context setup failed")] * len(entries)
+        elif len(entries) == 1:
+            outcomes = [self.send_signal(*entries[0])]
+        else:
+            workers = self.settings['workers'] or self.MAX_WORKERS
+            with ThreadPoolExecutor(max_workers=min(workers, len(entries))) as executor:
+                outcomes = list(executor.map(lambda entry: self.send_signal(*entry), entries))
+                
+        return [
+            {"host": host, "port": port, "success": success, "message": message}
+            for (host, port, _), (success, message) in zip(entries, outcomes)
+        ]
+            
     def send_signals_from_file(self, file_path: str) -> Dict[str, Any]:
         """Send self-destruct signals to all servers listed in a file"""
-        if not os.path.exists(file_path):
-            self.logger.error(f"Node list file not found: {file_path}")
-            return {"success": False, "message": f"Node list file not found: {file_path}", "results": []}
-            
-        results = []
-        success_count = 0
-        failure_count = 0
-        
         try:
             with open(file_path, 'r') as f:
-                lines = [line.strip() for line in f if line.strip() and not line.strip().startswith('#')]
-                
-            if not lines:
-                self.logger.warning(f"No valid entries found in {file_path}")
-                return {"success": False, "message": "No valid entries found in node list", "results": []}
-                
-            for i, line in enumerate(lines):
-                try:
-                    # Parse the line format: host port key
-                    parts = line.split()
-                    if len(parts) < 3:
-                        self.logger.warning(f"Invalid entry format at line {i+1}: {line}")
-                        results.append({
-                            "host": "unknown",
-                            "port": 0,
-                            "success": False,
-                            "message": f"Invalid entry format: {line}"
-                        })
-                        failure_count += 1
-                        continue
-                        
-                    host = parts[0]
-                    port = int(parts[1])
-                    key = parts[2]
-                    
-                    self.logger.info(f"Sending signal to node {i+1}: {host}:{port}")
-                    success, message = self.send_signal(host, port, key)
-                    
-                    result = {
-                        "host": host,
-                        "port": port,
-                        "success": success,
-                        "message": message
-                    }
-                    
-                    results.append(result)
-                    
-                    if success:
-                        success_count += 1
-                    else:
-                        failure_count += 1
-                        
-                except Exception as e:
-                    self.logger.error(f"Error processing entry at line {i+1}: {e}")
-                    results.append({
-                        "host": parts[0] if len(parts) > 0 else "unknown",
-                        "port": int(parts[1]) if len(parts) > 1 else 0,
-                        "success": False,
-                        "message": f"Processing error: {str(e)}"
-                    })
-                    failure_count += 1
-                    
-            return {
-                "success": success_count > 0,
-                "message": f"Processed {len(results)} node(s): {success_count} succeeded, {failure_count} failed",
-                "results": results
-            }
-            
+                data = f.read()
+        except FileNotFoundError:
+            self.logger.error(f"Node list file not found: {file_path}")
+            return {"success": False, "message": f"Node list file not found: {file_path}", "results": []}
         except Exception as e:
             self.logger.error(f"Error processing node list: {e}")
-            return {"success": False, "message": f"Error processing node list: {str(e)}", "results": results}
+            return {"success": False, "message": f"Error processing node list: {str(e)}", "results": []}
+            
+        # Strip and filter in one pass, keeping file line numbers for messages
+        lines = [(number, line) for number, line in enumerate((raw.strip() for raw in data.splitlines()), 1)
+                 if line and not line.startswith('#')]
+        if not lines:
+            self.logger.warning(f"No valid entries found in {file_path}")
+            return {"success": False, "message": "No valid entries found in node list", "results": []}
+            
+        # Parse the line format: host port key. Invalid lines keep their
+        # result in place so the output follows the file order
+        parsed = []
+        entries = []
+        for number, line in lines:
+            parts = line.split()
+            try:
+                if len(parts) < 3:
+                    raise ValueError("expected: host port key")
+                entry = (parts[0], int(parts[1]), parts[2])
+            except ValueError:
+                self.logger.warning(f"Invalid entry format at line {number}: {line}")
+                parsed.append({
+                    "host": parts[0] if parts else "unknown",
+                    "port": 0,
+                    "success": False,
+                    "message": f"Invalid entry format: {line}"
+                })
+                continue
+            parsed.append(None)
+            entries.append(entry)
+            
+        self.logger.info(f"Sending signal to {len(entries)} node(s)")
+        sent = iter(self.send_signals_batch(entries))
+        results = [result if result is not None else next(sent) for result in parsed]
+        
+        success_count = sum(1 for result in results if result["success"])
+        failure_count = len(results) - success_count
+        return {
+            "success": success_count > 0,
+            "message": f"Processed {len(results)} node(s): {success_count} succeeded, {failure_count} failed",
+            "results": results
+        }
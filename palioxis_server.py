@@ -3,35 +3,82 @@
 # This file contains the server implementation with mTLS and DPoP security
 
 import os
+import re
 import ssl
+import hmac
+import base64
 import socket
 import logging
-import daemon
 import signal
 import json
+import selectors
+import threading
 import time
-import jwt
-from typing import Dict, Any, Optional
-
-from cryptography.hazmat.primitives import serialization
-from cryptography.x509 import load_pem_x509_certificate
+import shutil
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional
 
 from destroyers import get_destroyer, BaseDestroyer
 from config_manager import ConfigManager
 
 
+# Content-Length header in a raw request head
+CONTENT_LENGTH_RE = re.compile(rb'^content-length:[ \t]*(\d+)[ \t]*\r?$', re.IGNORECASE | re.MULTILINE)
+
+
+def _response(status: str, body: str) -> bytes:
+    """Build a complete response with explicit framing"""
+    return (f"HTTP/1.1 {status}\r\nContent-Length: {len(body)}\r\n"
+            f"Connection: close\r\n\r\n{body}").encode('ascii')
+
+
+def _b64url_decode(data) -> bytes:
+    """Decode unpadded base64url data"""
+    if isinstance(data, str):
+        data = data.encode('ascii')
+    return base64.urlsafe_b64decode(data + b'=' * (-len(data) % 4))
+
+
+def _b64url_uint(data) -> int:
+    """Decode a base64url-encoded big-endian unsigned integer"""
+    return int.from_bytes(_b64url_decode(data), 'big')
+
+
 class PalioxisServer:
     """Server class for the Palioxis self-destruct system"""
     
+    # Largest request accepted from a client
+    MAX_REQUEST_SIZE = 16384
+    
+    # Seconds a client may stall during the handshake or request
+    CONNECTION_TIMEOUT = 30
+    
+    # Prebuilt responses
+    RESP_MALFORMED = _response("400 Bad Request", "Malformed Request")
+    RESP_INVALID_FORMAT = _response("400 Bad Request", "Invalid Request Format")
+    RESP_UNAUTHORIZED = _response("401 Unauthorized", "Invalid DPoP Proof")
+    RESP_ACCEPTED = _response("200 OK", "Signal Accepted. Initiating self-destruct.")
+    RESP_FORBIDDEN = _response("403 Forbidden", "Invalid Key")
+    RESP_NOT_ALLOWED = _response("405 Method Not Allowed", "Unsupported Request")
+    RESP_SERVER_ERROR = _response("500 Internal Server Error", "Server Error")
+    
     def __init__(self, config_manager: ConfigManager):
         """Initialize with a ConfigManager instance"""
         self.config_manager = config_manager
         self.logger = logging.getLogger('palioxis.server')
         self.settings = self.config_manager.get_server_settings()
+        # Values checked on every request, resolved once
+        self._key_bytes = self.settings['key'].encode()
+        self._url_prefix = f"https://{self.settings['host']}:{self.settings['port']}"
         self.destroyer_settings = self.config_manager.get_destroyer_settings()
+        # Built up front so the self-destruct path only has to run it
+        self._destroyer = get_destroyer(self.destroyer_settings['module'], self.destroyer_settings)
         self.server_socket = None
         self.ssl_context = None
         self.target_directories = self.config_manager.get_target_directories()
+        # Only one self-destruct sequence may run
+        self._destruct_lock = threading.Lock()
         
     def setup_ssl_context(self) -> bool:
         """Set up the SSL context for mTLS"""
@@ -61,11 +108,15 @@ class PalioxisServer:
             
             sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
             sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            # Accepted sockets inherit this; responses are single small writes
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
             sock.bind((host, port))
             sock.listen(5)
+            sock.setblocking(False)
             
-            # Wrap the server socket with the SSL context
-            self.server_socket = self.ssl_context.wrap_socket(sock, server_side=True)
+            # TLS is set up per connection on a worker thread, so a slow
+            # handshake doesn't hold up the accept loop
+            self.server_socket = sock
             
             self.logger.info(f"Server socket bound to {host}:{port}")
             return True
@@ -75,125 +126,166 @@ class PalioxisServer:
             
     def verify_dpop_proof(self, token: str, client_public_key, http_method: str, http_url: str) -> bool:
         """Verify the DPoP proof from the client"""
+        # Imported on first use so loading this module stays cheap
+        from cryptography.exceptions import InvalidSignature
+        from cryptography.hazmat.primitives import hashes
+        from cryptography.hazmat.primitives.asymmetric import padding
+        
         if not token:
             self.logger.error("No DPoP token provided")
             return False
             
         try:
-            # Get the unverified header to extract the JWK
-            unverified_header = jwt.get_unverified_header(token)
-            # Extract public key from DPoP header
-            jwk = unverified_header['jwk']
-            
-            # Convert JWK to public key
-            dpop_public_key = jwt.algorithms.RSAAlgorithm.from_jwk(json.dumps(jwk))
+            if isinstance(token, str):
+                token = token.encode('ascii')
+            header_b64, payload_b64, signature_b64 = token.split(b'.')
+            header = json.loads(_b64url_decode(header_b64))
             
-            # Compare the DPoP key with the mTLS client cert key
-            client_pem = client_public_key.public_bytes(
-                encoding=serialization.Encoding.PEM,
-                format=serialization.PublicFormat.SubjectPublicKeyInfo
-            )
-            dpop_pem = dpop_public_key.public_bytes(
-                encoding=serialization.Encoding.PEM,
-                format=serialization.PublicFormat.SubjectPublicKeyInfo
-            )
-            
-            if client_pem != dpop_pem:
+            # Only RS256 proofs are issued by the client; never let the
+            # token choose a weaker algorithm
+            if header.get('alg') != 'RS256':
+                self.logger.error(f"Unsupported DPoP algorithm: {header.get('alg')}")
+                return False
+                
+            # Compare the DPoP key with the mTLS client cert key. When they
+            # match, the certificate key itself verifies the signature
+            jwk = header['jwk']
+            client_numbers = client_public_key.public_numbers()
+            if (jwk.get('kty') != 'RSA' or _b64url_uint(jwk['n']) != client_numbers.n
+                    or _b64url_uint(jwk['e']) != client_numbers.e):
                 self.logger.error("DPoP key does not match mTLS client certificate key")
                 return False
                 
-            # Verify the token signature and claims
-            decoded_token = jwt.decode(
-                token,
-                dpop_public_key,
-                algorithms=[unverified_header['alg']],
-                options={"verify_aud": False}  # No audience claim in DPoP
-            )
+            # Verify the token signature
+            client_public_key.verify(_b64url_decode(signature_b64), header_b64 + b'.' + payload_b64,
+                                     padding.PKCS1v15(), hashes.SHA256())
             
             # Check claims
-            assert decoded_token['htm'] == http_method
-            assert decoded_token['htu'] == http_url
-            assert time.time() - decoded_token['iat'] < 300  # Must be recent (within 5 minutes)
+            claims = json.loads(_b64url_decode(payload_b64))
+            if claims['htm'] != http_method or claims['htu'] != http_url:
+                self.logger.error("DPoP proof was issued for a different request")
+                return False
+            if abs(time.time() - claims['iat']) >= 300:  # Must be recent (within 5 minutes)
+                self.logger.error("DPoP proof has expired")
+                return False
             
             self.logger.info("DPoP proof successfully verified")
             return True
+        except InvalidSignature:
+            self.logger.error("DPoP verification failed: invalid signature")
+            return False
         except Exception as e:
             self.logger.error(f"DPoP verification failed: {e}")
             return False
             
+    def read_request(self, conn: ssl.SSLSocket) -> bytes:
+        """Read one request, framed by its headers and Content-Length"""
+        buf = bytearray(self.MAX_REQUEST_SIZE)
+        view = memoryview(buf)
+        received = 0
+        expected = None
+        
+        # A request normally arrives in a single read; keep reading only
+        # until the headers and the announced body are complete
+        while received < len(buf):
+            count = conn.recv_into(view[received:])
+            if not count:
+                break
+            received += count
+            if expected is None:
+                header_end = buf.find(b'\r\n\r\n', 0, received)
+                if header_end < 0:
+                    continue
+                match = CONTENT_LENGTH_RE.search(buf, 0, header_end)
+                expected = header_end + 4 + (int(match.group(1)) if match else 0)
+            if received >= expected:
+                break
+                
+        return bytes(view[:received])
+        
+    def serve_client(self, sock: socket.socket, addr: tuple) -> None:
+        """Complete the TLS handshake for an accepted socket and handle the request"""
+        try:
+            sock.settimeout(self.CONNECTION_TIMEOUT)
+            conn = self.ssl_context.wrap_socket(sock, server_side=True)
+        except (ssl.SSLError, OSError) as e:
+            self.logger.warning(f"TLS handshake with {addr} failed: {e}")
+            sock.close()
+            return
+        self.handle_connection(conn, addr)
+        
     def handle_connection(self, conn: ssl.SSLSocket, addr: tuple) -> None:
         """Handle an incoming client connection"""
+        from cryptography.x509 import NameOID, load_der_x509_certificate
+        
         self.logger.info(f"Handling connection from {addr}")
         
         try:
             # Get the client's certificate for DPoP verification
             client_cert_der = conn.getpeercert(binary_form=True)
-            client_cert = load_pem_x509_certificate(client_cert_der)
+            client_cert = load_der_x509_certificate(client_cert_der)
             client_public_key = client_cert.public_key()
             
-            # Common name from client certificate
-            client_cn = None
-            for item in conn.getpeercert()['subject']:
-                for key, value in item:
-                    if key == 'commonName':
-                        client_cn = value
+            # Common name from the same parsed certificate
+            common_names = client_cert.subject.get_attributes_for_oid(NameOID.COMMON_NAME)
+            client_cn = common_names[-1].value if common_names else None
                         
             self.logger.info(f"Client authenticated as: {client_cn}")
             
             # Read the HTTP-like request from the client
-            request_data = conn.recv(4096).decode()
+            request_data = self.read_request(conn)
             if not request_data:
                 self.logger.error("Empty request received")
                 return
                 
-            self.logger.debug(f"Received request: {request_data[:100]}...")
+            self.logger.debug("Received request: %r...", request_data[:100])
             
-            # Parse the HTTP-like request
-            try:
-                headers, body = request_data.split('\r\n\r\n', 1)
-            except ValueError:
+            # Parse the HTTP-like request; everything stays bytes except the
+            # request line, PyJWT accepts the DPoP token as bytes
+            headers, separator, body = request_data.partition(b'\r\n\r\n')
+            if not separator:
                 self.logger.error("Malformed request - could not split headers and body")
-                conn.sendall(b"HTTP/1.1 400 Bad Request\r\n\r\nMalformed Request")
+                conn.sendall(self.RESP_MALFORMED)
                 return
                 
-            # Extract DPoP proof from headers
-            dpop_proof = None
             request_method = None
             request_path = None
             
-            # Parse the request line and headers
-            for i, line in enumerate(headers.split('\r\n')):
-                if i == 0:  # Request line
-                    try:
-                        request_method, request_path, _ = line.split(' ', 2)
-                    except ValueError:
-                        self.logger.error(f"Malformed request line: {line}")
-                elif line.lower().startswith('dpop:'):
-                    dpop_proof = line.split(' ', 1)[1]
+            # Parse the request line, then the headers into a dict keyed by
+            # lowercased name; values stay raw bytes
+            request_line, *header_lines = headers.split(b'\r\n')
+            try:
+                request_method, request_path, _ = request_line.decode('latin-1').split(' ', 2)
+            except ValueError:
+                self.logger.error(f"Malformed request line: {request_line!r}")
+            header_fields = {}
+            for line in header_lines:
+                name, colon, value = line.partition(b':')
+                if colon:
+                    header_fields[name.strip().lower()] = value.strip()
+                    
+            # Extract DPoP proof from headers
+            dpop_proof = header_fields.get(b'dpop')
             
             if not request_method or not request_path:
                 self.logger.error("Missing request method or path")
-                conn.sendall(b"HTTP/1.1 400 Bad Request\r\n\r\nInvalid Request Format")
+                conn.sendall(self.RESP_INVALID_FORMAT)
                 return
                 
             # Construct the full URL for DPoP verification
-            host = self.settings['host']
-            port = self.settings['port']
-            http_url = f"https://{host}:{port}{request_path}"
+            http_url = self._url_prefix + request_path
             
             # Verify DPoP proof
             if not self.verify_dpop_proof(dpop_proof, client_public_key, request_method, http_url):
                 self.logger.error("DPoP verification failed")
-                conn.sendall(b"HTTP/1.1 401 Unauthorized\r\n\r\nInvalid DPoP Proof")
+                conn.sendall(self.RESP_UNAUTHORIZED)
                 return
                 
             # Check if this is a destroy request
             if request_method == 'POST' and request_path == '/destroy':
-                key = self.settings['key']
-                
-                if body.strip() == key:
+                if hmac.compare_digest(body.strip(), self._key_bytes):
                     self.logger.info("Valid destroy key received, initiating self-destruct")
-                    conn.sendall(b"HTTP/1.1 200 OK\r\n\r\nSignal Accepted. Initiating self-destruct.")
+                    conn.sendall(self.RESP_ACCEPTED)
                     
                     # Close the connection before destruction
                     conn.close()
@@ -201,15 +293,15 @@ class PalioxisServer:
                     # Execute the self-destruction
                     self.handle_self_destruct()
                 else:
-                    self.logger.warning(f"Invalid destroy key received: '{body.strip()}'")
-                    conn.sendall(b"HTTP/1.1 403 Forbidden\r\n\r\nInvalid Key")
+                    self.logger.warning(f"Invalid destroy key received: {body.strip()!r}")
+                    conn.sendall(self.RESP_FORBIDDEN)
             else:
                 self.logger.warning(f"Unsupported request: {request_method} {request_path}")
-                conn.sendall(b"HTTP/1.1 405 Method Not Allowed\r\n\r\nUnsupported Request")
+                conn.sendall(self.RESP_NOT_ALLOWED)
         except Exception as e:
             self.logger.error(f"Error handling connection: {e}")
             try:
-                conn.sendall(b"HTTP/1.1 500 Internal Server Error\r\n\r\nServer Error")
+                conn.sendall(self.RESP_SERVER_ERROR)
             except:
                 pass
         finally:
@@ -220,64 +312,62 @@ class PalioxisServer:
                 
     def handle_self_destruct(self) -> None:
         """Handle the self-destruct signal"""
+        if not self._destruct_lock.acquire(blocking=False):
+            self.logger.warning("Self-destruct sequence already in progress")
+            return
+            
         self.logger.warning("EXECUTING SELF-DESTRUCT SEQUENCE")
         
-        # Create the destroyer module based on configuration
-        module_name = self.destroyer_settings['module']
-        destroyer = get_destroyer(module_name, self.destroyer_settings)
-        
-        # Destroy all target directories
-        if self.target_directories:
-            self.logger.info(f"Destroying {len(self.target_directories)} target directories")
-            destroyer.destroy_paths(self.target_directories)
+        # Destroy target directories and TrueCrypt volumes in one call so the
+        # destroyer can schedule all the work together
+        truecrypt_volumes = self.collect_truecrypt_volumes()
+        paths = list(self.target_directories) + truecrypt_volumes
+        if paths:
+            self.logger.info(f"Destroying {len(self.target_directories)} target directories "
+                             f"and {len(truecrypt_volumes)} TrueCrypt volumes")
+            self._destroyer.destroy_paths(paths)
         else:
             self.logger.warning("No target directories specified for destruction")
             
-        # Handle TrueCrypt volumes if any
-        self.destroy_truecrypt_volumes()
+        if truecrypt_volumes:
+            self.dismount_truecrypt_volumes()
         
         # Final shutdown
         self.logger.critical("Self-destruct sequence completed. Shutting down system.")
         try:
-            os.system('shutdown -h now')
+            # Flush whatever the destroyers wrote, then exec shutdown
+            # directly rather than through a shell
+            os.sync()
+            subprocess.Popen([shutil.which('shutdown') or '/sbin/shutdown', '-h', 'now'], close_fds=True)
         except Exception as e:
             self.logger.error(f"Failed to shutdown system: {e}")
             
-    def destroy_truecrypt_volumes(self) -> None:
-        """Check for and destroy any TrueCrypt volumes"""
-        try:
-            import subprocess
+    def collect_truecrypt_volumes(self) -> List[str]:
+        """Return the paths of mounted TrueCrypt volumes"""
+        # Check if TrueCrypt is installed
+        if not shutil.which('truecrypt'):
+            self.logger.info("TrueCrypt not found, skipping TrueCrypt volume destruction")
+            return []
             
-            # Check if TrueCrypt is installed
-            try:
-                subprocess.run(['truecrypt', '--version'], stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-            except (subprocess.SubprocessError, FileNotFoundError):
-                self.logger.info("TrueCrypt not found, skipping TrueCrypt volume destruction")
-                return
-                
-            # Look for mounted TrueCrypt volumes
-            drives = subprocess.check_output('ls /media', shell=True).decode().split('\n')
-            truecrypt_drives = [d for d in drives if d and 'truecrypt' in d]
-            
-            if not truecrypt_drives:
-                self.logger.info("No mounted TrueCrypt volumes found")
-                return
-                
-            # Create destroyer for TrueCrypt volumes
-            destroyer = get_destroyer(self.destroyer_settings['module'], self.destroyer_settings)
+        # Look for mounted TrueCrypt volumes
+        try:
+            with os.scandir('/media') as entries:
+                volumes = [entry.path for entry in entries if 'truecrypt' in entry.name.lower()]
+        except OSError as e:
+            self.logger.error(f"Error looking for TrueCrypt volumes: {e}")
+            return []
             
-            # Destroy each TrueCrypt volume
-            for drive in truecrypt_drives:
-                volume_path = f"/media/{drive}"
-                self.logger.info(f"Destroying TrueCrypt volume: {volume_path}")
-                destroyer.destroy_dir(volume_path)
-                
-            # Dismount TrueCrypt volumes
-            self.logger.info("Dismounting all TrueCrypt volumes")
+        if not volumes:
+            self.logger.info("No mounted TrueCrypt volumes found")
+        return volumes
+        
+    def dismount_truecrypt_volumes(self) -> None:
+        """Dismount all TrueCrypt volumes"""
+        self.logger.info("Dismounting all TrueCrypt volumes")
+        try:
             subprocess.run(['truecrypt', '-d'], check=True)
-            
         except Exception as e:
-            self.logger.error(f"Error handling TrueCrypt volumes: {e}")
+            self.logger.error(f"Error dismounting TrueCrypt volumes: {e}")
             
     def run_server(self, daemonize: bool = False) -> None:
         """Run the server, optionally as a daemon"""
@@ -299,22 +389,33 @@ class PalioxisServer:
         signal.signal(signal.SIGINT, self.handle_signal)
         signal.signal(signal.SIGTERM, self.handle_signal)
         
-        # Main server loop
+        # Main server loop; accepted connections are handled on a worker pool
+        selector = selectors.DefaultSelector()
+        selector.register(self.server_socket, selectors.EVENT_READ)
+        executor = ThreadPoolExecutor(max_workers=(os.cpu_count() or 1) * 2)
         try:
             while True:
-                conn, addr = self.server_socket.accept()
-                self.logger.info(f"Client connected from {addr}")
-                self.handle_connection(conn, addr)
+                for _ in selector.select():
+                    try:
+                        conn, addr = self.server_socket.accept()
+                    except (BlockingIOError, InterruptedError):
+                        continue
+                    self.logger.info(f"Client connected from {addr}")
+                    executor.submit(self.serve_client, conn, addr)
         except KeyboardInterrupt:
             self.logger.info("Server interrupted, shutting down...")
         except Exception as e:
             self.logger.error(f"Server error: {e}")
         finally:
+            selector.close()
+            executor.shutdown(wait=False)
             if self.server_socket:
                 self.server_socket.close()
                 
     def start_daemon(self) -> None:
         """Start the server as a daemon process"""
+        import daemon
+        
         daemon_settings = self.config_manager.get_daemon_settings()
         log_file = daemon_settings['log_file']
         
@@ -330,8 +431,7 @@ class PalioxisServer:
         # Setup log file
         try:
             log_dir = os.path.dirname(os.path.abspath(log_file))
-            if not os.path.exists(log_dir):
-                os.makedirs(log_dir)
+            os.makedirs(log_dir, exist_ok=True)
         except Exception as e:
             self.logger.error(f"Failed to create log directory: {e}")
             
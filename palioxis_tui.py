@@ -1,17 +1,39 @@
 #!/usr/bin/env python3
 # Palioxis TUI: Simple Text-based User Interface for Palioxis
 
+import io
 import os
+import re
 import sys
 import time
+import shutil
+import signal
+import hashlib
+import selectors
 import subprocess
-from typing import Dict, List, Callable
+import traceback
+import tarfile
+import functools
+import contextlib
+from enum import Enum
+from typing import Dict, List, Callable, Tuple, Iterable, Iterator, Optional
+
+# Single-key input needs termios, which is only available on POSIX
+try:
+    import termios
+    import tty
+except ImportError:
+    termios = None
+
+# readline gives input() line editing and in-session history where available
+try:
+    import readline
+except ImportError:
+    readline = None
 
 # Import local modules
 try:
-    from config_manager import ConfigManager
-    from palioxis_server import PalioxisServer
-    from palioxis_client import PalioxisClient
+    from config_manager import ConfigManager, FastConfigParser
 except ImportError:
     print("[error] Cannot import required modules. Make sure you're in the Palioxis directory.")
     sys.exit(1)
@@ -26,13 +48,221 @@ class Colors:
     END = '\033[0m'
     BOLD = '\033[1m'
 
+# Static screen text, formatted once and written with a single call per redraw
+_BAR = f"{Colors.HEADER}{Colors.BOLD}{'=' * 60}{Colors.END}"
+_HEADER_BANNER = "\n".join([
+    _BAR,
+    f"{Colors.HEADER}{Colors.BOLD}               PALIOXIS CONTROL INTERFACE               {Colors.END}",
+    _BAR,
+    f"{Colors.YELLOW}Greek personification of the backrush or retreat from battle.{Colors.END}",
+    f"{Colors.YELLOW}Linux self-destruction utility with Tier 2 Security.{Colors.END}",
+    f"{Colors.RED}{Colors.BOLD}USE WITH CAUTION - ALL ACTIONS ARE FINAL{Colors.END}",
+    _BAR,
+    "\n"
+])
+_RETURN_PROMPT = "\nPress Enter to return to menu..."
+
+# One line of the target listing: number, path, status
+_TARGET_LINE = f"{Colors.GREEN}%d.{Colors.END} %s - %s\n"
+_TARGET_FOUND = f"{Colors.GREEN}(exists){Colors.END}"
+_TARGET_MISSING = f"{Colors.RED}(not found){Colors.END}"
+
+# Static text pages, with their colours already applied
+_DEPLOY_INSTRUCTIONS = "\n".join([
+    f"{Colors.BLUE}{Colors.BOLD}Deployment Instructions{Colors.END}\n",
+    f"{Colors.YELLOW}=== Installing Palioxis ==={Colors.END}",
+    "1. Extract the Palioxis package:",
+    "   tar -xzf palioxis-package.tar.gz",
+    "   cd palioxis-package\n",
+    "2. Install dependencies:",
+    "   pip install pyjwt cryptography python-daemon configparser\n",
+    "3. Generate certificates (if not included):",
+    "   chmod +x generate_certificates.sh",
+    "   ./generate_certificates.sh\n",
+    "4. Create configuration:",
+    "   cp palioxis.conf.example palioxis.conf",
+    "   nano palioxis.conf  # Edit settings as needed\n",
+    "5. Create target directories file:",
+    "   cp targets.txt.example targets.txt",
+    "   nano targets.txt  # Add directories to destroy\n",
+    f"{Colors.YELLOW}=== Running Palioxis ==={Colors.END}",
+    "- As a server:",
+    "  python3 palioxis.py --mode server --host 0.0.0.0 --port 8443\n",
+    "- As a daemon:",
+    "  python3 palioxis.py --mode server --daemon\n",
+    "- As a systemd service:",
+    "  sudo python3 palioxis.py --install-daemon\n",
+    "- As a client:",
+    "  python3 palioxis.py --mode client --list nodes.txt\n",
+    "- Using the TUI:",
+    "  python3 palioxis_tui.py\n",
+    f"{Colors.YELLOW}=== Security Considerations ==={Colors.END}",
+    "- Keep certificate files secure",
+    "- Use strong keys for authentication",
+    "- Run server with appropriate permissions",
+    "- Test the system thoroughly before relying on it",
+    ""
+])
+_CERTS_GENERATED = "\n".join([
+    f"\n{Colors.GREEN}Certificates generated successfully!{Colors.END}",
+    f"{Colors.GREEN}Files saved in the certs/ directory:{Colors.END}",
+    f"  - {Colors.BLUE}ca.crt{Colors.END} - Certificate Authority cert",
+    f"  - {Colors.BLUE}server.crt{Colors.END} - Server certificate",
+    f"  - {Colors.BLUE}server.key{Colors.END} - Server private key",
+    f"  - {Colors.BLUE}client.crt{Colors.END} - Client certificate",
+    f"  - {Colors.BLUE}client.key{Colors.END} - Client private key",
+    ""
+])
+
+# Files written or packaged verbatim, kept as bytes so they need no encoding
+_CERT_SCRIPT = b"""#!/bin/bash
+# Certificate Generation Script for Palioxis
+
+# Create directory for certificates
+mkdir -p certs
+cd certs
+
+# Generate CA key and certificate (ECDSA P-256: keygen is near-instant, unlike RSA 4096)
+openssl genpkey -algorithm EC -pkeyopt ec_paramgen_curve:P-256 -out ca.key
+openssl req -new -x509 -key ca.key -out ca.crt -subj "/CN=PalioxisCA" -days 3650 -sha256
+
+# Generate server key and certificate request
+openssl genpkey -algorithm EC -pkeyopt ec_paramgen_curve:P-256 -out server.key
+openssl req -new -key server.key -out server.csr -subj "/CN=PalioxisServer"
+
+# Sign server certificate with CA
+openssl x509 -req -in server.csr -CA ca.crt -CAkey ca.key -CAcreateserial -out server.crt -days 365 -sha256
+
+# Generate client key and certificate request
+# The client key also signs RS256 DPoP proofs, so it must stay RSA
+openssl genrsa -out client.key 2048
+openssl req -new -key client.key -out client.csr -subj "/CN=PalioxisClient"
+
+# Sign client certificate with CA
+openssl x509 -req -in client.csr -CA ca.crt -CAkey ca.key -CAcreateserial -out client.crt -days 365 -sha256
+
+# Clean up CSR files
+rm *.csr
+
+echo "Certificate generation complete."
+"""
+_EXAMPLE_FILES = {
+    "palioxis.conf.example": b"""[Server]
+host = 0.0.0.0
+port = 8443
+
+[Client]
+nodes_file = nodes.txt
+
+[Security]
+ca_cert = certs/ca.crt
+server_cert = certs/server.crt
+server_key = certs/server.key
+client_cert = certs/client.crt
+client_key = certs/client.key
+
+[Destruction]
+target_dirs = targets.txt
+destroyer = secure_wipe
+
+[Logging]
+log_file = palioxis.log
+log_level = INFO
+""",
+    "nodes.txt.example": b"""# Example nodes file
+# Format: <host> <port> <key>
+localhost 8443 secret_key
+192.168.1.100 8443 another_key
+""",
+    "targets.txt.example": b"""# Example targets file
+# Each line is a directory or file to be destroyed
+/path/to/directory/to/destroy
+/path/to/sensitive/file.txt
+""",
+}
+
+_PALIOXIS_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'palioxis.py')
+
+# A node list entry: <host> <port> <key>
+_NODE_RE = re.compile(r'(\S+)\s+(\S+)\s+(\S+)')
+
+# Certificate details shown by view_certificates. Parsed details are keyed by
+# the SHA-256 of the PEM, so renamed or duplicate files reuse them; the path
+# index records the digest last seen for each (path, mtime_ns, size)
+_CERT_BY_PATH: Dict[Tuple[str, int, int], bytes] = {}
+_CERT_BY_SHA: Dict[bytes, List[str]] = {}
+
+# How values read from the config file are coerced; unlisted keys stay strings
+_CONFIG_SCHEMA: Dict[str, Callable[[str], object]] = {
+    'target_dirs': lambda value: value.split(','),
+    'port': int,
+}
+
+class MenuState(Enum):
+    """Menus the TUI can be showing"""
+    MAIN = 'main'
+    SERVER = 'server'
+    CLIENT = 'client'
+    CONFIG = 'config'
+    CERT = 'cert'
+    DEPLOYMENT = 'deployment'
+
+def action_page(method):
+    """Run a menu action on a fresh screen and wait for Enter once it has finished"""
+    @functools.wraps(method)
+    def wrapper(self):
+        self.print_header()
+        method(self)
+        input(_RETURN_PROMPT)
+    return wrapper
+
 # Main TUI class
 class PalioxisTUI:
     def __init__(self):
         """Initialize the TUI"""
         self.config_manager = ConfigManager()
         self.running = True
-        self.menu_stack = []
+        self.state = MenuState.MAIN
+        self.state_stack: List[MenuState] = []
+        # Pending output for the frame being drawn, written out in one go
+        self._frame: List[str] = []
+        self._menu_text: Dict[Tuple[str, bool], str] = {}
+        # Title and options for each menu; an option's action is either the
+        # menu state to switch to or a method to run
+        self.menus: Dict[MenuState, Tuple[str, List[Dict]]] = {
+            MenuState.MAIN: ("MAIN MENU", [
+                {"text": "Server Operations", "action": MenuState.SERVER},
+                {"text": "Client Operations", "action": MenuState.CLIENT},
+                {"text": "Configuration Management", "action": MenuState.CONFIG},
+                {"text": "Certificate Management", "action": MenuState.CERT},
+                {"text": "Deployment Management", "action": MenuState.DEPLOYMENT},
+            ]),
+            MenuState.SERVER: ("SERVER OPERATIONS", [
+                {"text": "Start server in foreground", "action": self.start_server_foreground},
+                {"text": "Start server as daemon", "action": self.start_server_daemon},
+                {"text": "Install server as systemd service", "action": self.install_server_systemd},
+                {"text": "View server status", "action": self.view_server_status},
+            ]),
+            MenuState.CLIENT: ("CLIENT OPERATIONS", [
+                {"text": "Send signal to a single server", "action": self.send_single_signal},
+                {"text": "Send signals using node list", "action": self.send_signals_from_file},
+                {"text": "Create/Edit node list", "action": self.edit_node_list},
+            ]),
+            MenuState.CONFIG: ("CONFIGURATION MANAGEMENT", [
+                {"text": "Edit configuration file", "action": self.edit_config_file},
+                {"text": "Add target directory", "action": self.add_target_directory},
+                {"text": "List target directories", "action": self.list_target_directories},
+                {"text": "Set destroyer module", "action": self.set_destroyer_module},
+            ]),
+            MenuState.CERT: ("CERTIFICATE MANAGEMENT", [
+                {"text": "Generate new certificates", "action": self.generate_certificates},
+                {"text": "View certificate information", "action": self.view_certificates},
+            ]),
+            MenuState.DEPLOYMENT: ("DEPLOYMENT MANAGEMENT", [
+                {"text": "Create deployment package", "action": self.create_deployment_package},
+                {"text": "Show deployment instructions", "action": self.show_deployment_instructions},
+            ]),
+        }
         
         # Default configuration values
         self.config = {
@@ -55,41 +285,137 @@ class PalioxisTUI:
         except Exception as e:
             print(f"[warning] Could not load config: {e}")
         
+    def emit(self, text: str):
+        """Queue text for the current frame"""
+        self._frame.append(text)
+        
+    def flush_frame(self):
+        """Write the queued frame to the terminal in a single write"""
+        if self._frame:
+            sys.stdout.write("".join(self._frame))
+            sys.stdout.flush()
+            self._frame.clear()
+        
     def clear_screen(self):
         """Clear the terminal screen"""
-        os.system('clear' if os.name == 'posix' else 'cls')
+        if os.name == 'posix':
+            # Home the cursor and erase the display without spawning clear(1)
+            self.emit("\x1b[H\x1b[2J")
+        else:
+            self.flush_frame()
+            os.system('cls')
         
-    def print_header(self):
+    def print_header(self, flush: bool = True):
         """Print the Palioxis header"""
         self.clear_screen()
-        print(f"{Colors.HEADER}{Colors.BOLD}{'=' * 60}{Colors.END}")
-        print(f"{Colors.HEADER}{Colors.BOLD}               PALIOXIS CONTROL INTERFACE               {Colors.END}")
-        print(f"{Colors.HEADER}{Colors.BOLD}{'=' * 60}{Colors.END}")
-        print(f"{Colors.YELLOW}Greek personification of the backrush or retreat from battle.{Colors.END}")
-        print(f"{Colors.YELLOW}Linux self-destruction utility with Tier 2 Security.{Colors.END}")
-        print(f"{Colors.RED}{Colors.BOLD}USE WITH CAUTION - ALL ACTIONS ARE FINAL{Colors.END}")
-        print(f"{Colors.HEADER}{Colors.BOLD}{'=' * 60}{Colors.END}\n")
+        self.emit(_HEADER_BANNER)
+        if flush:
+            self.flush_frame()
         
     def print_menu(self, title: str, options: List[Dict[str, str]], show_back: bool = True):
         """Print a menu with numbered options"""
-        print(f"{Colors.BLUE}{Colors.BOLD}{title}{Colors.END}\n")
-        
-        for i, option in enumerate(options, 1):
-            print(f"{Colors.GREEN}{i}.{Colors.END} {option['text']}")
+        show_back = show_back and bool(self.state_stack)
+        # Menus never change, so each one is formatted once and reused
+        text = self._menu_text.get((title, show_back))
+        if text is None:
+            lines = [f"{Colors.BLUE}{Colors.BOLD}{title}{Colors.END}\n\n"]
             
-        if show_back and self.menu_stack:
-            print(f"{Colors.RED}b.{Colors.END} Back to previous menu")
+            for i, option in enumerate(options, 1):
+                lines.append(f"{Colors.GREEN}{i}.{Colors.END} {option['text']}\n")
+                
+            if show_back:
+                lines.append(f"{Colors.RED}b.{Colors.END} Back to previous menu\n")
+                
+            lines.append(f"{Colors.RED}q.{Colors.END} Quit\n\n")
+            text = self._menu_text[(title, show_back)] = "".join(lines)
             
-        print(f"{Colors.RED}q.{Colors.END} Quit")
-        print()
+        self.emit(text)
+        self.flush_frame()
         
+    def read_key(self, prompt: str) -> str:
+        """Read a single keypress without waiting for Enter, if the terminal allows it"""
+        if termios is None or not sys.stdin.isatty():
+            return input(prompt)
+            
+        sys.stdout.write(prompt)
+        sys.stdout.flush()
+        fd = sys.stdin.fileno()
+        saved = termios.tcgetattr(fd)
+        try:
+            # cbreak keeps signal keys working, so Ctrl+C still interrupts;
+            # TCSANOW rather than the default TCSAFLUSH keeps typeahead
+            tty.setcbreak(fd, termios.TCSANOW)
+            key = '\n'
+            while key in ('\r', '\n', '\x1b'):
+                # Read through sys.stdin so typeahead is shared with input()
+                key = sys.stdin.read(1)
+                if not key:
+                    raise EOFError
+                if key == '\x1b':
+                    # Arrow and function keys send escape sequences; ignore them
+                    self._discard_escape_sequence(fd)
+        finally:
+            termios.tcsetattr(fd, termios.TCSADRAIN, saved)
+        print(key)
+        return key
+        
+    def _discard_escape_sequence(self, fd: int):
+        """Drop the rest of an escape sequence, waiting at most 0.1s for more of it"""
+        cbreak = termios.tcgetattr(fd)
+        timed = list(cbreak)
+        timed[6] = list(cbreak[6])
+        # With VMIN 0 a read returns nothing once VTIME tenths of a second pass
+        timed[6][termios.VMIN] = 0
+        timed[6][termios.VTIME] = 1
+        termios.tcsetattr(fd, termios.TCSANOW, timed)
+        try:
+            while sys.stdin.read(1):
+                pass
+        finally:
+            termios.tcsetattr(fd, termios.TCSANOW, cbreak)
+        
+    def confirm(self, prompt: str) -> bool:
+        """Ask a yes/NO question; anything but "yes" declines"""
+        answer = input(prompt)
+        # Enter or "n" is the usual reply; reject it before normalising
+        return len(answer) >= 3 and answer.strip().lower() == "yes"
+        
+    def wait_for_return(self, log_file: Optional[str] = None, offset: int = 0):
+        """Wait for Enter, showing anything appended to log_file in the meantime"""
+        if log_file is None or os.name != 'posix' or not sys.stdin.isatty():
+            input(_RETURN_PROMPT)
+            return
+            
+        try:
+            log = open(log_file, 'rb')
+        except OSError:
+            input(_RETURN_PROMPT)
+            return
+            
+        print(f"\n{Colors.BLUE}Following {log_file}. Press Enter to return to menu...{Colors.END}\n")
+        # Regular files can't be registered with epoll, so only stdin is
+        # watched and the log is polled whenever the select times out
+        with log, selectors.DefaultSelector() as selector:
+            log.seek(offset)
+            selector.register(sys.stdin, selectors.EVENT_READ)
+            while True:
+                chunk = log.read()
+                if chunk:
+                    sys.stdout.write(chunk.decode(errors='replace'))
+                    sys.stdout.flush()
+                if selector.select(timeout=0.5):
+                    sys.stdin.readline()
+                    return
+                    
     def get_choice(self, max_choice: int) -> str:
         """Get user input for menu choice"""
+        prompt = f"{Colors.BOLD}Enter your choice: {Colors.END}"
         while True:
-            choice = input(f"{Colors.BOLD}Enter your choice: {Colors.END}").strip().lower()
+            # Menus with more than nine options need the full line
+            choice = (self.read_key(prompt) if max_choice < 10 else input(prompt)).strip().lower()
             if choice == 'q':
                 return choice
-            elif choice == 'b' and self.menu_stack:
+            elif choice == 'b' and self.state_stack:
                 return choice
             try:
                 num_choice = int(choice)
@@ -99,137 +425,36 @@ class PalioxisTUI:
                 pass
             print(f"{Colors.RED}Invalid choice. Please try again.{Colors.END}")
     
-    def main_menu(self):
-        """Display the main menu"""
-        options = [
-            {"text": "Server Operations", "action": self.server_menu},
-            {"text": "Client Operations", "action": self.client_menu},
-            {"text": "Configuration Management", "action": self.config_menu},
-            {"text": "Certificate Management", "action": self.cert_menu},
-            {"text": "Deployment Management", "action": self.deployment_menu},
-        ]
-        
-        self.print_header()
-        self.print_menu("MAIN MENU", options, show_back=False)
-        
-        choice = self.get_choice(len(options))
-        if choice == 'q':
-            self.running = False
-        else:
-            action = options[int(choice) - 1]["action"]
-            self.menu_stack.append(self.main_menu)
-            action()
-            
-    def server_menu(self):
-        """Display server operations menu"""
-        options = [
-            {"text": "Start server in foreground", "action": self.start_server_foreground},
-            {"text": "Start server as daemon", "action": self.start_server_daemon},
-            {"text": "Install server as systemd service", "action": self.install_server_systemd},
-            {"text": "View server status", "action": self.view_server_status},
-        ]
-        
-        self.print_header()
-        self.print_menu("SERVER OPERATIONS", options)
-        
-        choice = self.get_choice(len(options))
-        if choice == 'q':
-            self.running = False
-        elif choice == 'b':
-            self.menu_stack.pop()()
-        else:
-            action = options[int(choice) - 1]["action"]
-            self.menu_stack.append(self.server_menu)
-            action()
-    
-    def client_menu(self):
-        """Display client operations menu"""
-        options = [
-            {"text": "Send signal to a single server", "action": self.send_single_signal},
-            {"text": "Send signals using node list", "action": self.send_signals_from_file},
-            {"text": "Create/Edit node list", "action": self.edit_node_list},
-        ]
-        
-        self.print_header()
-        self.print_menu("CLIENT OPERATIONS", options)
+    def show_menu(self, title: str, options: List[Dict], show_back: bool = True):
+        """Show a menu and move to the state picked by the user"""
+        # Header and menu go out as one frame
+        self.print_header(flush=False)
+        self.print_menu(title, options, show_back)
         
         choice = self.get_choice(len(options))
         if choice == 'q':
             self.running = False
         elif choice == 'b':
-            self.menu_stack.pop()()
+            self.state = self.state_stack.pop()
         else:
             action = options[int(choice) - 1]["action"]
-            self.menu_stack.append(self.client_menu)
-            action()
-    
-    def config_menu(self):
-        """Display configuration management menu"""
-        options = [
-            {"text": "Edit configuration file", "action": self.edit_config_file},
-            {"text": "Add target directory", "action": self.add_target_directory},
-            {"text": "List target directories", "action": self.list_target_directories},
-            {"text": "Set destroyer module", "action": self.set_destroyer_module},
-        ]
-        
-        self.print_header()
-        self.print_menu("CONFIGURATION MANAGEMENT", options)
-        
-        choice = self.get_choice(len(options))
-        if choice == 'q':
-            self.running = False
-        elif choice == 'b':
-            self.menu_stack.pop()()
-        else:
-            action = options[int(choice) - 1]["action"]
-            self.menu_stack.append(self.config_menu)
-            action()
-            
-    def cert_menu(self):
-        """Display certificate management menu"""
-        options = [
-            {"text": "Generate new certificates", "action": self.generate_certificates},
-            {"text": "View certificate information", "action": self.view_certificates},
-        ]
-        
-        self.print_header()
-        self.print_menu("CERTIFICATE MANAGEMENT", options)
-        
-        choice = self.get_choice(len(options))
-        if choice == 'q':
-            self.running = False
-        elif choice == 'b':
-            self.menu_stack.pop()()
-        else:
-            action = options[int(choice) - 1]["action"]
-            self.menu_stack.append(self.cert_menu)
-            action()
-            
-    def deployment_menu(self):
-        """Display deployment management menu"""
-        options = [
-            {"text": "Create deployment package", "action": self.create_deployment_package},
-            {"text": "Show deployment instructions", "action": self.show_deployment_instructions},
-        ]
-        
-        self.print_header()
-        self.print_menu("DEPLOYMENT MANAGEMENT", options)
+            if isinstance(action, MenuState):
+                self.state_stack.append(self.state)
+                self.state = action
+            else:
+                # Actions return here, so the same menu is shown again afterwards
+                action()
+                
+    def run_current_menu(self):
+        """Show the menu for the current state"""
+        title, options = self.menus[self.state]
+        self.show_menu(title, options, show_back=self.state is not MenuState.MAIN)
         
-        choice = self.get_choice(len(options))
-        if choice == 'q':
-            self.running = False
-        elif choice == 'b':
-            self.menu_stack.pop()()
-        else:
-            action = options[int(choice) - 1]["action"]
-            self.menu_stack.append(self.deployment_menu)
-            action()
-    
     # -------------- Server Operations --------------
     
+    @action_page
     def start_server_foreground(self):
         """Start Palioxis server in foreground mode"""
-        self.print_header()
         print(f"{Colors.BLUE}{Colors.BOLD}Starting Server in Foreground{Colors.END}\n")
         
         # Get server parameters
@@ -244,27 +469,29 @@ class PalioxisTUI:
         print(f"\n{Colors.YELLOW}Starting server at {host}:{port}{Colors.END}")
         print(f"{Colors.YELLOW}Press Ctrl+C to stop the server{Colors.END}\n")
         
+        # The server takes its address and certificates from the configuration
+        self.config_manager.update('Server', 'host', host)
+        self.config_manager.update('Server', 'port', port)
+        
+        # run_server installs its own SIGINT/SIGTERM handlers, which exit
+        handlers = {sig: signal.getsignal(sig) for sig in (signal.SIGINT, signal.SIGTERM)}
         try:
+            # Imported here so menus that never start a server don't pay for it
+            from palioxis_server import PalioxisServer
+            
             # Create server instance
-            server = PalioxisServer(
-                host=host, 
-                port=port,
-                ca_cert=self.config['ca_cert'],
-                cert_file=self.config['server_cert'],
-                key_file=self.config['server_key'],
-                target_dirs=self.config['target_dirs']
-            )
+            server = PalioxisServer(self.config_manager)
             
             print(f"{Colors.GREEN}Server initialized. Starting...{Colors.END}")
-            server.start()
+            server.run_server()
             
-        except KeyboardInterrupt:
+        except (KeyboardInterrupt, SystemExit):
             print(f"\n{Colors.YELLOW}Server stopped by user{Colors.END}")
         except Exception as e:
             print(f"\n{Colors.RED}Error starting server: {e}{Colors.END}")
-        
-        input("\nPress Enter to return to menu...")
-        self.menu_stack.pop()()
+        finally:
+            for sig, handler in handlers.items():
+                signal.signal(sig, handler)
     
     def start_server_daemon(self):
         """Start Palioxis server as a daemon"""
@@ -280,26 +507,40 @@ class PalioxisTUI:
             print(f"{Colors.RED}Invalid port number. Using default.{Colors.END}")
             port = int(self.config['port'])
         
-        log_file = input(f"Enter log file [{self.config['log_file']}]: ").strip() or self.config['log_file']
-        
         print(f"\n{Colors.YELLOW}Starting daemon at {host}:{port}{Colors.END}")
-        print(f"{Colors.YELLOW}Logs will be written to {log_file}{Colors.END}\n")
+        print(f"{Colors.YELLOW}Logs will be written to {self.config['log_file']}{Colors.END}\n")
         
-        # Execute palioxis.py with daemon flags
-        cmd = f"python3 palioxis.py --mode server --host {host} --port {port} --daemon --log-file {log_file}"
+        # Remember where the log ends so only this run's output is followed
+        log_file = self.config['log_file']
+        try:
+            log_offset = os.path.getsize(log_file)
+        except OSError:
+            log_offset = 0
+        
+        # Execute palioxis.py with daemon flags, detached from this terminal
+        cmd = [sys.executable, _PALIOXIS_SCRIPT, '--mode', 'server',
+               '--host', host, '--port', str(port), '--daemon']
         
         try:
-            subprocess.run(cmd, shell=True, check=True)
-            print(f"\n{Colors.GREEN}Server daemon started successfully{Colors.END}")
-        except subprocess.CalledProcessError as e:
+            proc = subprocess.Popen(cmd, start_new_session=True, stdin=subprocess.DEVNULL,
+                                    stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            # The launcher exits as soon as the daemon has detached; only wait
+            # that long so startup errors can still be reported
+            returncode = proc.wait(timeout=5)
+            if returncode == 0:
+                print(f"\n{Colors.GREEN}Server daemon started successfully{Colors.END}")
+            else:
+                print(f"\n{Colors.RED}Error starting server daemon (exit code {returncode}){Colors.END}")
+        except subprocess.TimeoutExpired:
+            print(f"\n{Colors.YELLOW}Server daemon is still starting, check the log for status{Colors.END}")
+        except OSError as e:
             print(f"\n{Colors.RED}Error starting server daemon: {e}{Colors.END}")
         
-        input("\nPress Enter to return to menu...")
-        self.menu_stack.pop()()
+        self.wait_for_return(log_file, log_offset)
     
+    @action_page
     def install_server_systemd(self):
         """Install Palioxis server as a systemd service"""
-        self.print_header()
         print(f"{Colors.BLUE}{Colors.BOLD}Installing Server as Systemd Service{Colors.END}\n")
         
         # Get server parameters
@@ -313,121 +554,124 @@ class PalioxisTUI:
         
         print(f"\n{Colors.YELLOW}Installing systemd service for {host}:{port}{Colors.END}")
         
-        cmd = f"sudo python3 palioxis.py --install-daemon --mode server --host {host} --port {port}"
+        cmd = ['sudo', sys.executable, _PALIOXIS_SCRIPT, '--install-daemon', '--mode', 'server',
+               '--host', host, '--port', str(port)]
         
         try:
-            subprocess.run(cmd, shell=True, check=True)
+            subprocess.run(cmd, check=True)
             print(f"\n{Colors.GREEN}Systemd service installed successfully{Colors.END}")
             print(f"{Colors.GREEN}Service name: palioxis.service{Colors.END}")
             print(f"{Colors.YELLOW}To start: sudo systemctl start palioxis.service{Colors.END}")
             print(f"{Colors.YELLOW}To enable at boot: sudo systemctl enable palioxis.service{Colors.END}")
-        except subprocess.CalledProcessError as e:
+        except (subprocess.CalledProcessError, OSError) as e:
             print(f"\n{Colors.RED}Error installing systemd service: {e}{Colors.END}")
-        
-        input("\nPress Enter to return to menu...")
-        self.menu_stack.pop()()
     
+    @action_page
     def view_server_status(self):
         """View Palioxis server status"""
-        self.print_header()
         print(f"{Colors.BLUE}{Colors.BOLD}Server Status{Colors.END}\n")
         
         try:
             # Check if systemd service is running
-            result = subprocess.run("systemctl is-active palioxis.service", shell=True, capture_output=True, text=True)
-            if result.stdout.strip() == "active":
+            try:
+                result = subprocess.run(["systemctl", "is-active", "palioxis.service"], capture_output=True, text=True)
+                active = result.stdout.strip() == "active"
+            except FileNotFoundError:
+                active = False
+            if active:
                 print(f"{Colors.GREEN}Systemd service: RUNNING{Colors.END}")
             else:
                 print(f"{Colors.RED}Systemd service: NOT RUNNING{Colors.END}")
                 
             # Check for any running Python process with palioxis
-            result = subprocess.run("ps aux | grep '[p]alioxis.py'", shell=True, capture_output=True, text=True)
-            if result.stdout.strip():
+            processes = self.find_palioxis_processes()
+            if processes:
                 print(f"\n{Colors.GREEN}Found running Palioxis processes:{Colors.END}")
-                print(result.stdout)
+                for pid, cmdline in processes:
+                    print(f"  {pid:>7}  {cmdline}")
             else:
                 print(f"\n{Colors.RED}No Palioxis processes found running{Colors.END}")
                 
         except Exception as e:
             print(f"\n{Colors.RED}Error checking server status: {e}{Colors.END}")
-        
-        input("\nPress Enter to return to menu...")
-        self.menu_stack.pop()()
+    
+    def find_palioxis_processes(self) -> List[Tuple[int, str]]:
+        """Find running palioxis.py processes by reading /proc directly"""
+        processes = []
+        own_pid = os.getpid()
+        with os.scandir('/proc') as entries:
+            for entry in entries:
+                if not entry.name.isdigit() or int(entry.name) == own_pid:
+                    continue
+                try:
+                    with open(f"/proc/{entry.name}/cmdline", 'rb') as f:
+                        cmdline = f.read()
+                except OSError:
+                    # The process exited or belongs to another user namespace
+                    continue
+                if b'palioxis.py' in cmdline:
+                    args = cmdline.rstrip(b'\0').split(b'\0')
+                    processes.append((int(entry.name), b' '.join(args).decode(errors='replace')))
+        return processes
     
     # -------------- Client Operations --------------
     
+    @action_page
     def send_single_signal(self):
         """Send a self-destruct signal to a single server"""
-        self.print_header()
         print(f"{Colors.RED}{Colors.BOLD}CAUTION: SENDING A SELF-DESTRUCT SIGNAL{Colors.END}\n")
         print(f"{Colors.RED}This action will trigger irreversible data destruction on the target server.{Colors.END}")
-        confirm = input(f"\n{Colors.BOLD}Are you absolutely sure you want to continue? (yes/NO): {Colors.END}").strip().lower()
-        
-        if confirm != "yes":
+        if not self.confirm(f"\n{Colors.BOLD}Are you absolutely sure you want to continue? (yes/NO): {Colors.END}"):
             print(f"\n{Colors.YELLOW}Operation cancelled.{Colors.END}")
-            input("\nPress Enter to return to menu...")
-            self.menu_stack.pop()()
             return
         
         # Get target server details
         host = input("Enter target server host: ").strip()
         if not host:
             print(f"\n{Colors.RED}Host cannot be empty.{Colors.END}")
-            input("\nPress Enter to return to menu...")
-            self.menu_stack.pop()()
             return
             
         try:
             port = int(input("Enter target server port: ").strip())
         except ValueError:
             print(f"\n{Colors.RED}Invalid port number.{Colors.END}")
-            input("\nPress Enter to return to menu...")
-            self.menu_stack.pop()()
             return
         
         # Secret key as additional verification
         secret_key = input("Enter secret key for verification: ").strip()
+        if readline is not None and secret_key:
+            # Keep the key out of the recallable history
+            readline.remove_history_item(readline.get_current_history_length() - 1)
         if not secret_key:
             print(f"\n{Colors.RED}Secret key cannot be empty.{Colors.END}")
-            input("\nPress Enter to return to menu...")
-            self.menu_stack.pop()()
             return
             
         print(f"\n{Colors.YELLOW}Sending self-destruct signal to {host}:{port}...{Colors.END}")
         
         try:
+            from palioxis_client import PalioxisClient
+            
             # Create client instance
-            client = PalioxisClient(
-                ca_cert=self.config['ca_cert'],
-                cert_file=self.config['client_cert'],
-                key_file=self.config['client_key']
-            )
+            client = PalioxisClient(self.config_manager)
             
             # Send the signal
-            success = client.send_signal(host, port, secret_key)
+            success, message = client.send_signal(host, port, secret_key)
             
             if success:
-                print(f"\n{Colors.GREEN}Signal sent successfully.{Colors.END}")
+                print(f"\n{Colors.GREEN}Signal sent successfully: {message}{Colors.END}")
             else:
-                print(f"\n{Colors.RED}Failed to send signal.{Colors.END}")
+                print(f"\n{Colors.RED}Failed to send signal: {message}{Colors.END}")
                 
         except Exception as e:
             print(f"\n{Colors.RED}Error sending signal: {e}{Colors.END}")
-        
-        input("\nPress Enter to return to menu...")
-        self.menu_stack.pop()()
     
+    @action_page
     def send_signals_from_file(self):
         """Send self-destruct signals to multiple servers from a nodes list file"""
-        self.print_header()
         print(f"{Colors.RED}{Colors.BOLD}CAUTION: SENDING SELF-DESTRUCT SIGNALS TO MULTIPLE SERVERS{Colors.END}\n")
         print(f"{Colors.RED}This action will trigger irreversible data destruction on ALL target servers.{Colors.END}")
-        confirm = input(f"\n{Colors.BOLD}Are you absolutely sure you want to continue? (yes/NO): {Colors.END}").strip().lower()
-        
-        if confirm != "yes":
+        if not self.confirm(f"\n{Colors.BOLD}Are you absolutely sure you want to continue? (yes/NO): {Colors.END}"):
             print(f"\n{Colors.YELLOW}Operation cancelled.{Colors.END}")
-            input("\nPress Enter to return to menu...")
-            self.menu_stack.pop()()
             return
         
         # Get nodes list file
@@ -435,34 +679,32 @@ class PalioxisTUI:
         
         if not os.path.exists(nodes_file):
             print(f"\n{Colors.RED}Nodes list file not found: {nodes_file}{Colors.END}")
-            input("\nPress Enter to return to menu...")
-            self.menu_stack.pop()()
             return
         
         print(f"\n{Colors.YELLOW}Sending self-destruct signals to all servers in {nodes_file}...{Colors.END}")
         
         try:
+            from palioxis_client import PalioxisClient
+            
             # Create client instance
-            client = PalioxisClient(
-                ca_cert=self.config['ca_cert'],
-                cert_file=self.config['client_cert'],
-                key_file=self.config['client_key']
-            )
+            client = PalioxisClient(self.config_manager)
             
-            # Send signals from file
-            success_count, total = client.send_signals_from_file(nodes_file)
+            # The client sends to all nodes concurrently over one shared SSL context
+            result = client.send_signals_from_file(nodes_file)
             
-            print(f"\n{Colors.GREEN}Signals sent: {success_count}/{total}{Colors.END}")
+            print()
+            for node in result['results']:
+                color = Colors.GREEN if node['success'] else Colors.RED
+                print(f"{color}{node['host']}:{node['port']} - {node['message']}{Colors.END}")
+            color = Colors.GREEN if result['success'] else Colors.RED
+            print(f"\n{color}{result['message']}{Colors.END}")
                 
         except Exception as e:
             print(f"\n{Colors.RED}Error sending signals: {e}{Colors.END}")
-        
-        input("\nPress Enter to return to menu...")
-        self.menu_stack.pop()()
     
+    @action_page
     def edit_node_list(self):
         """Create or edit a node list file"""
-        self.print_header()
         print(f"{Colors.BLUE}{Colors.BOLD}Edit Nodes List{Colors.END}\n")
         
         nodes_file = input(f"Enter nodes list file path [{self.config['nodes_file']}]: ").strip() or self.config['nodes_file']
@@ -470,9 +712,11 @@ class PalioxisTUI:
         if os.path.exists(nodes_file):
             print(f"\n{Colors.YELLOW}Existing nodes file found. Current content:{Colors.END}")
             try:
+                print()
                 with open(nodes_file, 'r') as f:
-                    content = f.read()
-                    print(f"\n{content}")
+                    for line in f:
+                        sys.stdout.write(line)
+                print()
             except Exception as e:
                 print(f"\n{Colors.RED}Error reading file: {e}{Colors.END}")
         else:
@@ -481,61 +725,67 @@ class PalioxisTUI:
         print(f"\n{Colors.BLUE}Enter nodes in format: <host> <port> <key>{Colors.END}")
         print(f"{Colors.BLUE}One node per line. Enter empty line to finish.{Colors.END}\n")
         
-        nodes = []
-        while True:
-            node = input("Node (or empty to finish): ").strip()
-            if not node:
-                break
-                
-            # Validate format
-            parts = node.split()
-            if len(parts) != 3:
-                print(f"{Colors.RED}Invalid format. Use: <host> <port> <key>{Colors.END}")
-                continue
-                
-            try:
-                int(parts[1])  # Check if port is a number
-                nodes.append(node)
-            except ValueError:
-                print(f"{Colors.RED}Invalid port number.{Colors.END}")
+        # Nodes are written as they are validated; the file is only opened
+        # (and truncated) once the first valid node arrives
+        out = None
+        count = 0
+        prompt = f"{Colors.BOLD}Node (or empty to finish): {Colors.END}"
+        try:
+            while True:
+                node = input(prompt).strip()
+                if not node:
+                    break
+                    
+                # Validate format
+                m = _NODE_RE.fullmatch(node)
+                if not m:
+                    print(f"{Colors.RED}Invalid format. Use: <host> <port> <key>{Colors.END}")
+                    continue
+                    
+                port = m.group(2)
+                if not (port.isascii() and port.isdigit() and 0 < int(port) < 65536):
+                    print(f"{Colors.RED}Invalid port number.{Colors.END}")
+                    continue
+                    
+                if out is None:
+                    out = open(nodes_file, 'w', buffering=1)
+                out.write(node + '\n')
+                count += 1
+        except Exception as e:
+            print(f"\n{Colors.RED}Error saving file: {e}{Colors.END}")
+        finally:
+            if out is not None:
+                out.close()
         
-        if nodes:
-            try:
-                with open(nodes_file, 'w') as f:
-                    f.write('\n'.join(nodes))
-                print(f"\n{Colors.GREEN}Nodes list saved to {nodes_file}{Colors.END}")
-            except Exception as e:
-                print(f"\n{Colors.RED}Error saving file: {e}{Colors.END}")
+        if count:
+            print(f"\n{Colors.GREEN}{count} node(s) saved to {nodes_file}{Colors.END}")
         else:
             print(f"\n{Colors.YELLOW}No nodes added. File not modified.{Colors.END}")
         
-        input("\nPress Enter to return to menu...")
-        self.menu_stack.pop()()
         
     # -------------- Configuration Management --------------
     
     def load_config(self):
         """Load configuration from config file"""
         try:
-            config = self.config_manager.load_config()
-            if config:
-                # Update our config with values from the file
-                for section in config.sections():
-                    for key, value in config[section].items():
-                        if key in self.config:
-                            if key == 'target_dirs':
-                                self.config[key] = value.split(',')
-                            else:
-                                self.config[key] = value
-                return True
-            return False
+            if not self.config_manager.load_config():
+                return False
+            config = self.config_manager.config
+            # Flatten every section into our keys in one pass, coercing by schema
+            self.config.update({
+                key: _CONFIG_SCHEMA.get(key, str)(value)
+                for section in config.sections()
+                for key, value in config[section].items()
+                if key in self.config and value is not None
+            })
+            return True
         except Exception as e:
             print(f"[error] Failed to load configuration: {e}")
             return False
     
+    @action_page
     def edit_config_file(self):
         """Edit the configuration file"""
-        self.print_header()
         print(f"{Colors.BLUE}{Colors.BOLD}Edit Configuration File{Colors.END}\n")
         
         config_file = input("Enter configuration file path [palioxis.conf]: ").strip() or "palioxis.conf"
@@ -584,13 +834,10 @@ log_level = INFO
                 self.load_config()
             except Exception as e:
                 print(f"\n{Colors.RED}Error creating configuration: {e}{Colors.END}")
-        
-        input("\nPress Enter to return to menu...")
-        self.menu_stack.pop()()
     
+    @action_page
     def add_target_directory(self):
         """Add a directory to the targets list"""
-        self.print_header()
         print(f"{Colors.BLUE}{Colors.BOLD}Add Target Directory{Colors.END}\n")
         
         targets_file = input("Enter targets file path [targets.txt]: ").strip() or "targets.txt"
@@ -604,15 +851,17 @@ log_level = INFO
         print(f"\n{Colors.BLUE}Current target directories:{Colors.END}")
         try:
             with open(targets_file, 'r') as f:
-                targets = f.read().strip().split('\n')
-                if targets and targets[0]:
-                    for i, target in enumerate(targets, 1):
-                        print(f"{Colors.GREEN}{i}.{Colors.END} {target}")
-                else:
+                # Stream the file line by line, skipping blank lines
+                count = 0
+                for line in f:
+                    target = line.strip()
+                    if target:
+                        count += 1
+                        print(f"{Colors.GREEN}{count}.{Colors.END} {target}")
+                if not count:
                     print(f"{Colors.YELLOW}No targets defined yet.{Colors.END}")
         except Exception as e:
             print(f"{Colors.RED}Error reading targets file: {e}{Colors.END}")
-            targets = []
         
         # Add new target
         new_target = input("\nEnter path to add to targets (or empty to cancel): ").strip()
@@ -634,44 +883,52 @@ log_level = INFO
                     print(f"{Colors.RED}Error adding target: {e}{Colors.END}")
         else:
             print(f"\n{Colors.YELLOW}No target added.{Colors.END}")
-        
-        input("\nPress Enter to return to menu...")
-        self.menu_stack.pop()()
     
+    @action_page
     def list_target_directories(self):
         """List all target directories"""
-        self.print_header()
         print(f"{Colors.BLUE}{Colors.BOLD}Target Directories{Colors.END}\n")
         
         targets_file = input("Enter targets file path [targets.txt]: ").strip() or "targets.txt"
         
         if not os.path.exists(targets_file):
             print(f"\n{Colors.YELLOW}Targets file not found: {targets_file}{Colors.END}")
-            input("\nPress Enter to return to menu...")
-            self.menu_stack.pop()()
             return
         
         # Show targets with details
         print(f"\n{Colors.BLUE}Target directories in {targets_file}:{Colors.END}\n")
         try:
             with open(targets_file, 'r') as f:
-                targets = f.read().strip().split('\n')
-                if targets and targets[0]:
-                    for i, target in enumerate(targets, 1):
-                        status = "exists" if os.path.exists(target) else "not found"
-                        status_color = Colors.GREEN if os.path.exists(target) else Colors.RED
-                        print(f"{Colors.GREEN}{i}.{Colors.END} {target} - {status_color}({status}){Colors.END}")
-                else:
+                # Stream the file so each target prints as soon as it is read
+                targets = (line.strip() for line in f)
+                count = 0
+                for count, (target, exists) in enumerate(self.paths_exist(t for t in targets if t), 1):
+                    sys.stdout.write(_TARGET_LINE % (count, target, _TARGET_FOUND if exists else _TARGET_MISSING))
+                if not count:
                     print(f"{Colors.YELLOW}No targets defined.{Colors.END}")
         except Exception as e:
             print(f"{Colors.RED}Error reading targets file: {e}{Colors.END}")
-        
-        input("\nPress Enter to return to menu...")
-        self.menu_stack.pop()()
     
+    def paths_exist(self, paths: Iterable[str]) -> Iterator[Tuple[str, bool]]:
+        """Yield each path with whether it exists, reading each parent directory only once"""
+        listings: Dict[str, set] = {}
+        for path in paths:
+            parent, name = os.path.split(os.path.normpath(path))
+            if not name or name in ('.', '..'):
+                yield path, os.path.exists(path)
+                continue
+            if parent not in listings:
+                try:
+                    listings[parent] = set(os.listdir(parent or '.'))
+                except OSError:
+                    listings[parent] = None
+            entries = listings[parent]
+            # Fall back to stat when the parent can't be listed
+            yield path, (name in entries if entries is not None else os.path.exists(path))
+        
+    @action_page
     def set_destroyer_module(self):
         """Select a destroyer module"""
-        self.print_header()
         print(f"{Colors.BLUE}{Colors.BOLD}Set Destroyer Module{Colors.END}\n")
         
         # Get available destroyer modules
@@ -694,7 +951,7 @@ log_level = INFO
                 # Update configuration file
                 config_file = "palioxis.conf"
                 if os.path.exists(config_file):
-                    config = configparser.ConfigParser()
+                    config = FastConfigParser()
                     config.read(config_file)
                     
                     if 'Destruction' not in config:
@@ -708,7 +965,7 @@ log_level = INFO
                     print(f"{Colors.GREEN}Updated configuration with {selected} destroyer.{Colors.END}")
                 else:
                     print(f"{Colors.YELLOW}Configuration file not found. Creating new one.{Colors.END}")
-                    config = configparser.ConfigParser()
+                    config = FastConfigParser()
                     config['Destruction'] = {'destroyer': selected}
                     
                     with open(config_file, 'w') as f:
@@ -722,152 +979,164 @@ log_level = INFO
         except Exception as e:
             print(f"\n{Colors.RED}Error setting destroyer: {e}{Colors.END}")
         
-        input("\nPress Enter to return to menu...")
-        self.menu_stack.pop()()
     
     # -------------- Certificate Management --------------
     
+    @action_page
     def generate_certificates(self):
         """Generate new mTLS certificates"""
-        self.print_header()
         print(f"{Colors.BLUE}{Colors.BOLD}Generate New Certificates{Colors.END}\n")
         
+        # The script runs openssl for every key and certificate; fail once, up front
+        if shutil.which("openssl") is None:
+            print(f"{Colors.RED}openssl not found. Install it to generate certificates.{Colors.END}")
+            return
+            
         print(f"{Colors.YELLOW}This will generate new CA, server, and client certificates for mTLS.{Colors.END}")
-        confirm = input(f"\n{Colors.BOLD}Are you sure you want to continue? (yes/NO): {Colors.END}").strip().lower()
-        
-        if confirm != "yes":
+        if not self.confirm(f"\n{Colors.BOLD}Are you sure you want to continue? (yes/NO): {Colors.END}"):
             print(f"\n{Colors.YELLOW}Certificate generation cancelled.{Colors.END}")
-            input("\nPress Enter to return to menu...")
-            self.menu_stack.pop()()
             return
+            
+        # RSA key generation is slow; don't redo it unless asked to
+        cert_files = ("ca.crt", "server.crt", "server.key", "client.crt", "client.key")
+        if all(os.path.exists(os.path.join("certs", name)) for name in cert_files):
+            if not self.confirm(f"\n{Colors.BOLD}Certificates already exist, regenerate? (yes/NO): {Colors.END}"):
+                print(f"\n{Colors.YELLOW}Keeping existing certificates.{Colors.END}")
+                return
         
         # Create certs directory if needed
-        if not os.path.exists("certs"):
+        try:
             os.makedirs("certs")
             print(f"{Colors.GREEN}Created certificates directory.{Colors.END}")
+        except FileExistsError:
+            pass
         
         print(f"\n{Colors.YELLOW}Generating certificates...{Colors.END}")
         try:
+            if not os.path.exists("generate_certificates.sh"):
+                print(f"\n{Colors.RED}Certificate generation script not found.{Colors.END}")
+                print(f"{Colors.YELLOW}Creating generate_certificates.sh script...{Colors.END}")
+                self.write_certificate_script()
+                print(f"{Colors.GREEN}Script created. Running it now...{Colors.END}")
+                
             # Run the certificate generation script
             subprocess.run(["./generate_certificates.sh"], check=True)
-            print(f"\n{Colors.GREEN}Certificates generated successfully!{Colors.END}")
-            print(f"{Colors.GREEN}Files saved in the certs/ directory:{Colors.END}")
-            print(f"  - {Colors.BLUE}ca.crt{Colors.END} - Certificate Authority cert")
-            print(f"  - {Colors.BLUE}server.crt{Colors.END} - Server certificate")
-            print(f"  - {Colors.BLUE}server.key{Colors.END} - Server private key")
-            print(f"  - {Colors.BLUE}client.crt{Colors.END} - Client certificate")
-            print(f"  - {Colors.BLUE}client.key{Colors.END} - Client private key")
-        except FileNotFoundError:
-            print(f"\n{Colors.RED}Certificate generation script not found.{Colors.END}")
-            print(f"{Colors.YELLOW}Creating generate_certificates.sh script...{Colors.END}")
-            
-            # Create the certificate generation script
-            with open("generate_certificates.sh", "w") as f:
-                f.write("""#!/bin/bash
-# Certificate Generation Script for Palioxis
-
-# Create directory for certificates
-mkdir -p certs
-cd certs
-
-# Generate CA key and certificate
-openssl genrsa -out ca.key 4096
-openssl req -new -x509 -key ca.key -out ca.crt -subj "/CN=PalioxisCA" -days 3650
-
-# Generate server key and certificate request
-openssl genrsa -out server.key 2048
-openssl req -new -key server.key -out server.csr -subj "/CN=PalioxisServer"
-
-# Sign server certificate with CA
-openssl x509 -req -in server.csr -CA ca.crt -CAkey ca.key -CAcreateserial -out server.crt -days 365
-
-# Generate client key and certificate request
-openssl genrsa -out client.key 2048
-openssl req -new -key client.key -out client.csr -subj "/CN=PalioxisClient"
-
-# Sign client certificate with CA
-openssl x509 -req -in client.csr -CA ca.crt -CAkey ca.key -CAcreateserial -out client.crt -days 365
-
-# Clean up CSR files
-rm *.csr
-
-echo "Certificate generation complete."
-""")
-            os.chmod("generate_certificates.sh", 0o755)
-            
-            print(f"{Colors.GREEN}Script created. Running it now...{Colors.END}")
-            subprocess.run(["./generate_certificates.sh"], check=True)
-            print(f"\n{Colors.GREEN}Certificates generated successfully!{Colors.END}")
+            sys.stdout.write(_CERTS_GENERATED)
         except subprocess.CalledProcessError as e:
             print(f"\n{Colors.RED}Error generating certificates: {e}{Colors.END}")
         except Exception as e:
             print(f"\n{Colors.RED}Error: {e}{Colors.END}")
         
-        input("\nPress Enter to return to menu...")
-        self.menu_stack.pop()()
+    def write_certificate_script(self):
+        """Write the certificate generation script used by generate_certificates"""
+        with open("generate_certificates.sh", "wb") as f:
+            f.write(_CERT_SCRIPT)
+        os.chmod("generate_certificates.sh", 0o755)
     
+    @action_page
     def view_certificates(self):
         """View certificate information"""
-        self.print_header()
         print(f"{Colors.BLUE}{Colors.BOLD}Certificate Information{Colors.END}\n")
         
         cert_dir = "certs"
-        if not os.path.exists(cert_dir):
+        try:
+            # DirEntry caches its file type and stat result, so nothing is stat-ed twice
+            with os.scandir(cert_dir) as it:
+                cert_files = [entry for entry in it
+                              if entry.name.endswith('.crt') and entry.is_file(follow_symlinks=False)]
+        except FileNotFoundError:
             print(f"{Colors.RED}Certificate directory not found.{Colors.END}")
             print(f"{Colors.YELLOW}You need to generate certificates first.{Colors.END}")
-            input("\nPress Enter to return to menu...")
-            self.menu_stack.pop()()
             return
         
-        cert_files = [f for f in os.listdir(cert_dir) if f.endswith('.crt')]
         if not cert_files:
             print(f"{Colors.RED}No certificate files found in {cert_dir}/{Colors.END}")
             print(f"{Colors.YELLOW}You need to generate certificates first.{Colors.END}")
-            input("\nPress Enter to return to menu...")
-            self.menu_stack.pop()()
             return
         
         for cert_file in cert_files:
-            print(f"{Colors.GREEN}Certificate: {cert_file}{Colors.END}")
+            print(f"{Colors.GREEN}Certificate: {cert_file.name}{Colors.END}")
             try:
-                result = subprocess.run(["openssl", "x509", "-in", f"{cert_dir}/{cert_file}", "-text", "-noout"], 
-                                        capture_output=True, text=True, check=True)
-                
-                # Extract and display important information
-                output = result.stdout
-                lines = output.split('\n')
+                details = self.certificate_details(cert_file.path, cert_file.stat())
                 
                 # Display subject, issuer, validity
                 print(f"  {Colors.BLUE}Details:{Colors.END}")
-                for line in lines:
-                    if any(key in line for key in ["Subject:", "Issuer:", "Not Before:", "Not After :"]):
-                        print(f"  {line.strip()}")
+                for line in details:
+                    print(f"  {line}")
                 print()
-            except subprocess.CalledProcessError as e:
+            except ValueError as e:
+                # Raised by cryptography for files that aren't valid PEM certificates
                 print(f"  {Colors.RED}Error reading certificate: {e}{Colors.END}\n")
             except Exception as e:
                 print(f"  {Colors.RED}Error: {e}{Colors.END}\n")
-        
-        input("\nPress Enter to return to menu...")
-        self.menu_stack.pop()()
     
+    def certificate_details(self, path: str, st: Optional[os.stat_result] = None) -> List[str]:
+        """Get subject, issuer and validity lines for a certificate, cached until the file changes"""
+        if st is None:
+            st = os.stat(path)
+        key = (path, st.st_mtime_ns, st.st_size)
+        digest = _CERT_BY_PATH.get(key)
+        if digest is not None:
+            return _CERT_BY_SHA[digest]
+            
+        with open(path, 'rb') as f:
+            data = f.read()
+        digest = hashlib.sha256(data).digest()
+        details = _CERT_BY_SHA.get(digest)
+        if details is None:
+            # cryptography is already required by the server and client
+            from cryptography import x509
+            
+            cert = x509.load_pem_x509_certificate(data)
+            # The *_utc properties only exist in newer cryptography releases
+            not_before = getattr(cert, 'not_valid_before_utc', None) or cert.not_valid_before
+            not_after = getattr(cert, 'not_valid_after_utc', None) or cert.not_valid_after
+            details = _CERT_BY_SHA[digest] = [
+                f"Subject: {cert.subject.rfc4514_string()}",
+                f"Issuer: {cert.issuer.rfc4514_string()}",
+                f"Not Before: {not_before}",
+                f"Not After : {not_after}",
+            ]
+        _CERT_BY_PATH[key] = digest
+        return details
+        
     # -------------- Deployment Management --------------
     
+    @contextlib.contextmanager
+    def open_package_archive(self, path: str) -> Iterator[tarfile.TarFile]:
+        """Open a .tar.gz for writing, compressing with pigz on all cores when available"""
+        pigz = shutil.which("pigz")
+        if pigz is None:
+            # Fast compression level; the package is small and size matters little
+            with tarfile.open(path, "w:gz", compresslevel=1) as tar:
+                yield tar
+            return
+            
+        with open(path, "wb") as out:
+            proc = subprocess.Popen([pigz, "-p", str(os.cpu_count() or 1), "-c"],
+                                    stdin=subprocess.PIPE, stdout=out)
+            try:
+                # Stream an uncompressed tar into pigz
+                with tarfile.open(fileobj=proc.stdin, mode="w|") as tar:
+                    yield tar
+            finally:
+                proc.stdin.close()
+                returncode = proc.wait()
+        if returncode != 0:
+            raise subprocess.CalledProcessError(returncode, pigz)
+            
+    @action_page
     def create_deployment_package(self):
         """Create a deployment package for distribution"""
-        self.print_header()
         print(f"{Colors.BLUE}{Colors.BOLD}Create Deployment Package{Colors.END}\n")
         
         package_name = input("Enter package name [palioxis-package]: ").strip() or "palioxis-package"
-        include_certs = input("Include certificates? (yes/NO): ").strip().lower() == "yes"
+        include_certs = self.confirm("Include certificates? (yes/NO): ")
         
         print(f"\n{Colors.YELLOW}Creating deployment package {package_name}.tar.gz...{Colors.END}")
         
         try:
-            # Create temporary directory
-            os.makedirs(package_name, exist_ok=True)
-            
-            # Copy required files
+            # Required files
             files_to_copy = [
                 "palioxis.py",
                 "palioxis_server.py",
@@ -879,116 +1148,44 @@ echo "Certificate generation complete."
                 "README.md"
             ]
             
-            for file in files_to_copy:
-                if os.path.exists(file):
-                    subprocess.run(["cp", file, package_name], check=True)
-            
-            # Create example configs
-            with open(f"{package_name}/palioxis.conf.example", "w") as f:
-                f.write("""[Server]
-host = 0.0.0.0
-port = 8443
-
-[Client]
-nodes_file = nodes.txt
-
-[Security]
-ca_cert = certs/ca.crt
-server_cert = certs/server.crt
-server_key = certs/server.key
-client_cert = certs/client.crt
-client_key = certs/client.key
-
-[Destruction]
-target_dirs = targets.txt
-destroyer = secure_wipe
-
-[Logging]
-log_file = palioxis.log
-log_level = INFO
-""")
-            
-            with open(f"{package_name}/nodes.txt.example", "w") as f:
-                f.write("""# Example nodes file
-# Format: <host> <port> <key>
-localhost 8443 secret_key
-192.168.1.100 8443 another_key
-""")
-                
-            with open(f"{package_name}/targets.txt.example", "w") as f:
-                f.write("""# Example targets file
-# Each line is a directory or file to be destroyed
-/path/to/directory/to/destroy
-/path/to/sensitive/file.txt
-""")
-            
-            # Include certificates if requested
-            if include_certs and os.path.exists("certs"):
-                subprocess.run(["cp", "-r", "certs", package_name], check=True)
-            
-            # Create package
-            subprocess.run(["tar", "-czf", f"{package_name}.tar.gz", package_name], check=True)
-            
-            # Clean up temporary directory
-            subprocess.run(["rm", "-rf", package_name], check=True)
+            # Stream everything straight into the archive, without staging a
+            # copy of the tree on disk or running cp/tar/rm
+            # Member names always use '/', whatever the local path separator
+            prefix = package_name + "/"
+            with self.open_package_archive(f"{package_name}.tar.gz") as tar:
+                for file in files_to_copy:
+                    # tar.add stats the file anyway; skip missing ones from that
+                    try:
+                        tar.add(file, arcname=prefix + file)
+                    except FileNotFoundError:
+                        pass
+                        
+                now = time.time()
+                for name, data in _EXAMPLE_FILES.items():
+                    info = tarfile.TarInfo(prefix + name)
+                    info.size = len(data)
+                    info.mtime = now
+                    tar.addfile(info, io.BytesIO(data))
+                    
+                # Include certificates if requested
+                if include_certs:
+                    try:
+                        tar.add("certs", arcname=prefix + "certs")
+                    except FileNotFoundError:
+                        pass
             
             print(f"\n{Colors.GREEN}Package created: {package_name}.tar.gz{Colors.END}")
                 
         except Exception as e:
             print(f"\n{Colors.RED}Error creating package: {e}{Colors.END}")
-        
-        input("\nPress Enter to return to menu...")
-        self.menu_stack.pop()()
     
     def show_deployment_instructions(self):
         """Show instructions for deploying Palioxis"""
-        self.print_header()
-        print(f"{Colors.BLUE}{Colors.BOLD}Deployment Instructions{Colors.END}\n")
-        
-        print(f"{Colors.YELLOW}=== Installing Palioxis ==={Colors.END}")
-        print("1. Extract the Palioxis package:")
-        print("   tar -xzf palioxis-package.tar.gz")
-        print("   cd palioxis-package\n")
-        
-        print("2. Install dependencies:")
-        print("   pip install pyjwt cryptography python-daemon configparser\n")
-        
-        print("3. Generate certificates (if not included):")
-        print("   chmod +x generate_certificates.sh")
-        print("   ./generate_certificates.sh\n")
-        
-        print("4. Create configuration:")
-        print("   cp palioxis.conf.example palioxis.conf")
-        print("   nano palioxis.conf  # Edit settings as needed\n")
-        
-        print("5. Create target directories file:")
-        print("   cp targets.txt.example targets.txt")
-        print("   nano targets.txt  # Add directories to destroy\n")
-        
-        print(f"{Colors.YELLOW}=== Running Palioxis ==={Colors.END}")
-        print("- As a server:")
-        print("  python3 palioxis.py --mode server --host 0.0.0.0 --port 8443\n")
-        
-        print("- As a daemon:")
-        print("  python3 palioxis.py --mode server --daemon\n")
-        
-        print("- As a systemd service:")
-        print("  sudo python3 palioxis.py --install-daemon\n")
-        
-        print("- As a client:")
-        print("  python3 palioxis.py --mode client --list nodes.txt\n")
-        
-        print("- Using the TUI:")
-        print("  python3 palioxis_tui.py\n")
-        
-        print(f"{Colors.YELLOW}=== Security Considerations ==={Colors.END}")
-        print("- Keep certificate files secure")
-        print("- Use strong keys for authentication")
-        print("- Run server with appropriate permissions")
-        print("- Test the system thoroughly before relying on it")
+        self.print_header(flush=False)
+        self.emit(_DEPLOY_INSTRUCTIONS)
+        self.flush_frame()
         
-        input("\nPress Enter to return to menu...")
-        self.menu_stack.pop()()
+        input(_RETURN_PROMPT)
 
 
 def main():
@@ -997,7 +1194,7 @@ def main():
     
     try:
         while tui.running:
-            tui.main_menu()
+            tui.run_current_menu()
     except KeyboardInterrupt:
         print("\n\nExiting Palioxis TUI...")
     except Exception as e:
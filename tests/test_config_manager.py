@@ -0,0 +1,58 @@
+import io
+
+from config_manager import ConfigManager, FastConfigParser
+
+
+def parse(text):
+    parser = FastConfigParser()
+    parser.read_file(io.StringIO(text))
+    return parser
+
+
+def test_continuation_lines_extend_the_previous_value():
+    parser = parse(
+        "[Targets]\n"
+        "directories = /srv/a\n"
+        "    /srv/b\n"
+        "\n"
+        "\t/srv/c\n"
+        "# a comment between values\n"
+        "    /srv/d\n"
+    )
+    assert parser.get("Targets", "directories") == "/srv/a\n/srv/b\n/srv/c\n/srv/d"
+
+
+def test_continuation_of_an_empty_value():
+    parser = parse("[Targets]\ndirectories =\n    /srv/a\n    /srv/b\n")
+    assert parser.get("Targets", "directories") == "/srv/a\n/srv/b"
+
+
+def test_options_comments_and_booleans():
+    parser = parse(
+        "; leading comment\n"
+        "[Destroyer]\n"
+        "Module : shred\n"
+        "overwrite_small_files = off\n"
+        "bare_option\n"
+    )
+    assert parser.get("Destroyer", "module") == "shred"
+    assert parser.getboolean("Destroyer", "overwrite_small_files") is False
+    assert parser.has_option("Destroyer", "bare_option")
+    assert parser.get("Destroyer", "bare_option") is None
+
+
+def test_target_directories_from_multiline_option(tmp_path):
+    config_file = tmp_path / "palioxis.conf"
+    config_file.write_text("[Targets]\ndirectories = /srv/a\n    /srv/b\n")
+    config = ConfigManager(str(config_file))
+    assert config.load_config()
+    assert config.get_target_directories() == ["/srv/a", "/srv/b"]
+
+
+def test_settings_are_returned_as_copies(tmp_path):
+    config = ConfigManager(str(tmp_path / "palioxis.conf"))
+    config.load_config()
+    config.get_server_settings()['port'] = 1
+    config.get_destroyer_settings()['module'] = 'shred'
+    assert config.get_server_settings()['port'] == 8443
+    assert config.get_destroyer_settings()['module'] == 'fast'
@@ -0,0 +1,176 @@
+import gc
+import os
+import subprocess
+import warnings
+
+import pytest
+
+import destroyers
+from destroyers import FastDestroyer, ShredDestroyer, WindowsDestroyer
+
+
+def test_inner_symlinks_are_removed_not_followed(tmp_path):
+    outside = tmp_path / "outside"
+    outside.write_bytes(b"keep me")
+    outside_dir = tmp_path / "outside_dir"
+    outside_dir.mkdir()
+    (outside_dir / "file").write_bytes(b"keep me too")
+    target = tmp_path / "target"
+    target.mkdir()
+    (target / "file_link").symlink_to(outside)
+    (target / "dir_link").symlink_to(outside_dir, target_is_directory=True)
+    (target / "dangling").symlink_to(tmp_path / "missing")
+
+    assert FastDestroyer().destroy_paths([str(target)])
+    assert not target.exists()
+    assert outside.read_bytes() == b"keep me"
+    assert (outside_dir / "file").read_bytes() == b"keep me too"
+
+
+def test_file_is_overwritten_before_removal(tmp_path, monkeypatch):
+    original = os.urandom(10000)
+    target = tmp_path / "secret"
+    target.write_bytes(original)
+    # Keep the truncate from hiding the overwritten contents
+    monkeypatch.setattr(os, "ftruncate", lambda fd, length: None)
+
+    with open(target, "rb") as f:
+        assert FastDestroyer({'fast_passes': 1}).destroy_paths([str(target)])
+        assert not target.exists()
+        overwritten = f.read()
+    assert len(overwritten) == len(original)
+    assert overwritten != original
+
+
+def make_tree(root):
+    """Build a nested tree of empty, small and multi-chunk files"""
+    paths = []
+    for depth in range(3):
+        root = root / f"level{depth}"
+        root.mkdir()
+        for i in range(FastDestroyer.GROUP_SIZE + 5):
+            path = root / f"file{i}"
+            path.write_bytes(os.urandom(i * 97))
+            paths.append(path)
+    (root / "empty").write_bytes(b"")
+    big = root / "big"
+    big.write_bytes(os.urandom(3 * 1024 + 17))
+    return paths + [root / "empty", big]
+
+
+@pytest.mark.parametrize("workers", [1, 4])
+def test_nested_tree_is_removed(tmp_path, monkeypatch, workers):
+    # A small write buffer exercises the multi-chunk overwrite loop
+    monkeypatch.setattr(FastDestroyer, "CHUNK_SIZE", 1024)
+    target = tmp_path / "target"
+    target.mkdir()
+    make_tree(target)
+
+    destroyer = FastDestroyer({'workers': workers, 'fast_passes': 1})
+    assert destroyer.destroy_paths([str(target)])
+    assert not target.exists()
+
+
+def test_symlinked_target_directory(tmp_path):
+    real = tmp_path / "real"
+    real.mkdir()
+    for name in ("a", "b", "c"):
+        (real / name).write_bytes(os.urandom(8192))
+    link = tmp_path / "link"
+    link.symlink_to(real, target_is_directory=True)
+
+    assert FastDestroyer().destroy_paths([str(link)])
+    assert not real.exists()
+
+
+def test_missing_path_is_not_an_error(tmp_path):
+    assert FastDestroyer().destroy_paths([str(tmp_path / "missing"), ""])
+
+
+@pytest.mark.skipif(not hasattr(os, "O_NOATIME"), reason="O_NOATIME is Linux only")
+def test_noatime_refusal_falls_back_to_plain_open(tmp_path, monkeypatch):
+    target = tmp_path / "file"
+    target.write_bytes(os.urandom(5000))
+    real_open = os.open
+
+    def refuse_noatime(path, flags, *args, **kwargs):
+        if flags & os.O_NOATIME:
+            raise PermissionError("O_NOATIME refused")
+        return real_open(path, flags, *args, **kwargs)
+    monkeypatch.setattr(os, "open", refuse_noatime)
+
+    assert FastDestroyer().destroy_paths([str(target)])
+    assert not target.exists()
+
+
+def test_partial_settings_fall_back_to_defaults():
+    destroyer = FastDestroyer({'fast_passes': 1})
+    assert destroyer.passes == 1
+    assert destroyer.overwrite_small_files is True
+    assert destroyer.workers >= 1
+
+
+def test_shred_skips_small_file_targets(tmp_path, monkeypatch):
+    target = tmp_path / "small"
+    target.write_bytes(b"x" * 100)
+    monkeypatch.setattr(subprocess, "run", lambda *args, **kwargs: pytest.fail("shred was run"))
+
+    destroyer = ShredDestroyer({'overwrite_small_files': False})
+    assert destroyer.destroy_paths([str(target)])
+    assert not target.exists()
+
+
+def test_empty_and_small_files_are_only_unlinked(tmp_path, monkeypatch):
+    empty = tmp_path / "empty"
+    empty.write_bytes(b"")
+    small = tmp_path / "small"
+    small.write_bytes(b"x" * 100)
+    real_open = os.open
+
+    def no_write_open(path, flags, *args, **kwargs):
+        assert not flags & os.O_WRONLY, "file was opened for overwriting"
+        return real_open(path, flags, *args, **kwargs)
+    monkeypatch.setattr(os, "open", no_write_open)
+
+    destroyer = FastDestroyer({'overwrite_small_files': False})
+    assert destroyer.destroy_paths([str(empty), str(small)])
+    assert not empty.exists()
+    assert not small.exists()
+
+
+def test_command_batches_respect_batch_size(monkeypatch):
+    monkeypatch.setattr(ShredDestroyer, "BATCH_SIZE", 10)
+    batches = ShredDestroyer()._batches([f"/tmp/file{i}" for i in range(25)])
+    assert [len(batch) for batch in batches] == [10, 10, 5]
+
+
+def test_no_descriptors_left_open(tmp_path):
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always", ResourceWarning)
+        for round_ in range(3):
+            target = tmp_path / f"target{round_}"
+            target.mkdir()
+            make_tree(target)
+            assert FastDestroyer({'workers': 4, 'fast_passes': 1}).destroy_paths([str(target)])
+        gc.collect()
+    assert not [w for w in caught if issubclass(w.category, ResourceWarning)]
+
+
+def test_windows_wipes_each_volume_once(tmp_path, monkeypatch):
+    calls = []
+    monkeypatch.setattr(subprocess, "run", lambda args, **kwargs: calls.append(args))
+    single = tmp_path / "single"
+    single.write_bytes(os.urandom(5000))
+    tree = tmp_path / "tree"
+    tree.mkdir()
+    (tree / "file").write_bytes(os.urandom(5000))
+    link = tmp_path / "link"
+    link.symlink_to(tree, target_is_directory=True)
+
+    destroyer = WindowsDestroyer()
+    assert destroyer.destroy_paths([str(single), str(link), str(tmp_path / "missing")])
+    assert not single.exists()
+    assert not tree.exists()
+    volume = destroyers._volume_root(str(tmp_path))
+    assert calls == [['cipher', '/w:' + volume]]
+
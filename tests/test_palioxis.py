@@ -0,0 +1,43 @@
+import sys
+
+import palioxis
+from config_manager import ConfigManager
+
+
+def make_app(tmp_path, monkeypatch, *argv):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(sys, "argv", ["palioxis", "--config", str(tmp_path / "palioxis.conf"), *argv])
+    app = palioxis.PalioxisApp()
+    app.parse_arguments()
+    app.load_configuration()
+    return app
+
+
+def test_add_targets_saves_config_once(tmp_path, monkeypatch):
+    first, second = tmp_path / "a", tmp_path / "b"
+    first.mkdir()
+    second.mkdir()
+    app = make_app(tmp_path, monkeypatch)
+    saves = []
+    real_save = ConfigManager.save_config
+    monkeypatch.setattr(ConfigManager, "save_config", lambda self: saves.append(1) or real_save(self))
+
+    assert app.add_target_directory(str(first), save=False)
+    assert app.add_target_directory(str(second), save=False)
+    assert not app.add_target_directory(str(first), save=False)
+    assert app.save_targets()
+    assert len(saves) == 1
+    assert str(second) in (tmp_path / "palioxis.conf").read_text()
+
+
+def test_add_targets_falls_back_to_targets_file(tmp_path, monkeypatch):
+    first, second = tmp_path / "a", tmp_path / "b"
+    first.mkdir()
+    second.mkdir()
+    app = make_app(tmp_path, monkeypatch)
+    monkeypatch.setattr(ConfigManager, "save_config", lambda self: False)
+
+    app.add_target_directory(str(first), save=False)
+    app.add_target_directory(str(second), save=False)
+    assert app.save_targets()
+    assert (tmp_path / "targets.txt").read_text().split() == [str(first), str(second)]
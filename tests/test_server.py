@@ -0,0 +1,49 @@
+from config_manager import ConfigManager
+from palioxis_server import PalioxisServer
+
+
+class FakeConnection:
+    """Socket stand-in that hands out the given chunks one recv at a time"""
+
+    def __init__(self, *chunks):
+        self.chunks = list(chunks)
+
+    def recv_into(self, view):
+        if not self.chunks:
+            return 0
+        chunk = self.chunks.pop(0)
+        count = min(len(chunk), len(view))
+        view[:count] = chunk[:count]
+        if count < len(chunk):
+            self.chunks.insert(0, chunk[count:])
+        return count
+
+
+def make_server(tmp_path):
+    return PalioxisServer(ConfigManager(str(tmp_path / "palioxis.conf")))
+
+
+def test_content_length_before_other_headers(tmp_path):
+    head = b"POST / HTTP/1.1\r\nContent-Length: 5\r\nDPoP: x\r\n\r\n"
+    conn = FakeConnection(head, b"hello", b"extra")
+    assert make_server(tmp_path).read_request(conn) == head + b"hello"
+
+
+def test_body_split_across_reads(tmp_path):
+    head = b"POST / HTTP/1.1\r\nDPoP: x\r\ncontent-length:  10 \r\n\r\n"
+    conn = FakeConnection(head[:20], head[20:] + b"12345", b"67890", b"extra")
+    assert make_server(tmp_path).read_request(conn) == head + b"1234567890"
+
+
+def test_request_without_content_length_ends_after_headers(tmp_path):
+    head = b"GET / HTTP/1.1\r\nHost: example\r\n\r\n"
+    conn = FakeConnection(head, b"ignored")
+    assert make_server(tmp_path).read_request(conn) == head
+
+
+def test_request_is_capped_at_max_size(tmp_path):
+    server = make_server(tmp_path)
+    head = b"POST / HTTP/1.1\r\nContent-Length: 99999\r\n\r\n"
+    body = b"x" * server.MAX_REQUEST_SIZE
+    conn = FakeConnection(head, body)
+    assert len(server.read_request(conn)) == server.MAX_REQUEST_SIZE